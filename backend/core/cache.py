@@ -0,0 +1,87 @@
+"""Process-wide short-TTL caches for expensive dashboard aggregates.
+
+City-wide predictions, totals and ward risk are identical across requests
+within a short window, so they are computed at most once per TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Set, Tuple
+
+from cachetools import TTLCache
+
+
+_cache: TTLCache = TTLCache(maxsize=8, ttl=45)
+_lock = threading.Lock()
+_MISSING = object()
+
+
+def ttl_cached(key: str) -> Callable:
+    """Cache a no-argument method's result under `key`.
+
+    The instance (and its DB session) is not part of the key: every caller
+    in the process shares the same cached value until it expires. The
+    wrapper takes no arguments, so a call that would need a different key
+    fails instead of returning another call's result.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(self) -> Any:
+            with _lock:
+                value = _cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = fn(self)
+            with _lock:
+                _cache[key] = value
+            return value
+        return wrapper
+    return decorator
+
+
+# Stale-while-revalidate entries: key -> (value, fetched_at monotonic seconds)
+_swr_entries: Dict[str, Tuple[Any, float]] = {}
+_swr_refreshing: Set[str] = set()
+
+
+def swr_cached(key: str, ttl: float = 30, stale_ttl: float = 300) -> Callable:
+    """Stale-while-revalidate cache for a no-argument service method.
+
+    Fresh values (younger than `ttl`) are returned directly. Once a value is
+    stale (younger than `stale_ttl`), the first caller recomputes it on its
+    own request and session while concurrent callers keep getting the stale
+    value; missing or expired entries are computed by whoever asks. Nothing
+    runs on a background thread, so no session shares the engine's single
+    SQLite connection behind a request's back.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(self) -> Any:
+            now = time.monotonic()
+            refreshing = False
+            with _lock:
+                entry = _swr_entries.get(key)
+                if entry is not None:
+                    value, fetched_at = entry
+                    age = now - fetched_at
+                    if age < ttl:
+                        return value
+                    if age < stale_ttl:
+                        if key in _swr_refreshing:
+                            return value
+                        _swr_refreshing.add(key)
+                        refreshing = True
+            try:
+                value = fn(self)
+                with _lock:
+                    _swr_entries[key] = (value, time.monotonic())
+            finally:
+                if refreshing:
+                    with _lock:
+                        _swr_refreshing.discard(key)
+            return value
+        return wrapper
+    return decorator
@@ -1,6 +1,11 @@
-from typing import Protocol, List, Dict, Any
+from typing import Protocol, List, Dict, Any, Optional
 from pathlib import Path
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+import atexit
 import csv
+import os
 import threading
 from datetime import datetime
 
@@ -38,9 +43,88 @@ class CSVDataAccess:
             return []
         with self.lock:
             with self.filepath.open("r", newline="") as f:
-                reader = list(csv.DictReader(f))
+                # Keep only the last n rows while streaming the file
+                tail = deque(csv.DictReader(f), maxlen=n)
                 # Return last n, newest last -> we want newest first
-                return list(reversed(reader))[:n]
+                return list(reversed(tail))
+
+
+class BufferedCSVDataAccess(CSVDataAccess):
+    """CSVDataAccess that batches appends instead of opening the file per row.
+
+    Rows are buffered and written through one long-lived handle and csv writer
+    when `max_rows` accumulate or `flush_interval` seconds pass, whichever
+    comes first. The newest `tail_size` rows are also kept in memory (as the
+    strings the CSV would hold), so read_last never touches the file unless
+    asked for more than that.
+
+    Assumes a single server process (start.sh and main.py run one uvicorn
+    worker). The buffer and tail are per process: with several workers each
+    one's read_last (and so /logs) only sees the rows that worker appended
+    since start-up, although every row still reaches the file.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        fieldnames: List[str],
+        max_rows: int = 512,
+        flush_interval: float = 0.25,
+        tail_size: int = 10_000,
+    ):
+        super().__init__(filepath, fieldnames)
+        self._tail: deque = deque(reversed(super().read_last(tail_size)), maxlen=tail_size)
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self._buffer: List[tuple] = []
+        self._timer: Optional[threading.Timer] = None
+        # Rows are buffered as positional tuples so flushes can hand them
+        # straight to the C csv writer in one writerows call
+        self._row_getter = itemgetter(*self.fieldnames)
+        # One O_APPEND descriptor for the process lifetime: every flush lands
+        # at the current end of file, even alongside other writers
+        fd = os.open(self.filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._fh = os.fdopen(fd, "a", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._fh)
+        atexit.register(self.flush)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        with self.lock:
+            try:
+                values = self._row_getter(record)
+                if len(self.fieldnames) == 1:
+                    values = (values,)
+            except KeyError:
+                # partial records (e.g. failure rows) fill missing fields
+                values = tuple(record.get(k, "") for k in self.fieldnames)
+            self._buffer.append(values)
+            self._tail.append(dict(zip(self.fieldnames, ("" if v is None else str(v) for v in values))))
+            if len(self._buffer) >= self.max_rows:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self._buffer.clear()
+            self._fh.flush()
+
+    def read_last(self, n: int) -> List[Dict[str, Any]]:
+        if n <= self._tail.maxlen:
+            with self.lock:
+                return list(islice(reversed(self._tail), n))
+        self.flush()
+        return super().read_last(n)
 
 
 # Simple factory for CSV storage used in this project
@@ -48,4 +132,4 @@ def make_csv_accessor(dataset_name: str, fieldnames: List[str]) -> CSVDataAccess
     base = Path(__file__).parents[1] / "datasets"
     base.mkdir(parents=True, exist_ok=True)
     filepath = base / f"{dataset_name}.csv"
-    return CSVDataAccess(str(filepath), fieldnames)
+    return BufferedCSVDataAccess(str(filepath), fieldnames)
@@ -9,7 +9,7 @@ from __future__ import annotations
 import os
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 from sqlalchemy.pool import StaticPool
 
@@ -66,3 +66,17 @@ def init_db() -> None:
     Safe to call multiple times (idempotent).
     """
     Base.metadata.create_all(bind=engine)
+
+    # create_all never alters existing tables; databases created before
+    # facilities.icu_capacity existed get the column (and its default) here
+    columns = {col["name"] for col in inspect(engine).get_columns("facilities")}
+    if "icu_capacity" not in columns:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "ALTER TABLE facilities ADD COLUMN icu_capacity INTEGER NOT NULL DEFAULT 20"
+            )
+
+    # create_all skips indexes on tables that already exist; add any new ones
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -1,6 +1,7 @@
 from typing import List
 from fastapi import WebSocket
 import asyncio
+import orjson
 
 
 class ConnectionManager:
@@ -15,18 +16,26 @@ class ConnectionManager:
         if websocket in self.active:
             self.active.remove(websocket)
 
-    async def broadcast(self, message: dict):
-        living = []
-        for conn in list(self.active):
+    async def _safe_send(self, conn: WebSocket, text: str) -> bool:
+        try:
+            await conn.send_text(text)
+            return True
+        except Exception:
             try:
-                await conn.send_json(message)
-                living.append(conn)
+                await conn.close()
             except Exception:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
-        self.active = living
+                pass
+            return False
+
+    async def broadcast(self, message: dict):
+        # Serialize once; every client gets the same pre-encoded text frame
+        text = orjson.dumps(message).decode()
+        # Fan out concurrently so one slow client doesn't stall the others
+        conns = list(self.active)
+        results = await asyncio.gather(*(self._safe_send(conn, text) for conn in conns))
+        dead = [conn for conn, ok in zip(conns, results) if not ok]
+        for conn in dead:
+            self.disconnect(conn)
 
 
 manager = ConnectionManager()
@@ -1,13 +1,15 @@
-from typing import Dict, Any
-from core.data_access import DataAccess
+from typing import Dict, Any, Iterable
 import statistics
 
 
-def detect_outbreaks(storage: DataAccess, record: Dict[str, Any]) -> bool:
+def detect_outbreaks(recent: Iterable[Dict[str, Any]], record: Dict[str, Any]) -> bool:
     """
     Simple outbreak detection:
     - If total_cases exceeds an absolute threshold
     - Or if total_cases is > 3x the median of the same indicator in recent records
+
+    `recent` is the in-memory window of the latest ingested rows (the caller
+    keeps it up to date), so no storage is re-read per record.
     """
     try:
         threshold = 200
@@ -15,9 +17,9 @@ def detect_outbreaks(storage: DataAccess, record: Dict[str, Any]) -> bool:
         if tc >= threshold:
             return True
 
-        # fetch recent records for same indicator and location
-        recent = storage.read_last(50)
-        same_indicator = [int(r.get("total_cases", 0)) for r in recent if r.get("indicatorname") == record.get("indicatorname")]
+        # recent records for same indicator and location
+        indicator = record.get("indicatorname")
+        same_indicator = [int(r.get("total_cases", 0)) for r in recent if r.get("indicatorname") == indicator]
         if not same_indicator:
             return False
         med = statistics.median(same_indicator)
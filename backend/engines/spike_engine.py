@@ -1,6 +1,6 @@
 import pandas as pd
 from engines.monthly_loader import load_monthly_health_data
-from utils.indicator_normalizer import normalize_indicator_name
+from utils.indicator_normalizer import normalize_disease_names
 
 # ⭐ Strong thresholds for high-confidence outbreaks
 MIN_CASE_THRESHOLD = 75
@@ -45,7 +45,7 @@ def detect_outbreaks():
     
     # 3. NORMALIZE indicator names to prevent duplicate aggregation
     # This ensures 'Malaria cases', 'New malaria-cases identified', etc. all map to 'New Malaria Cases'
-    df["indicatorname"] = df["indicatorname"].apply(normalize_indicator_name)
+    normalize_disease_names(df, "indicatorname")
 
     # aggregate
     grouped = (
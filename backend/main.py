@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from routers.ingestion_router import router as patient_ingestion_router 
 from routers.risk_router import router as risk_router
@@ -13,7 +14,10 @@ from core.database import init_db
 from fastapi import WebSocket, WebSocketDisconnect
 from core.ws_manager import manager
 
-app = FastAPI(title="SMC Smart Health Intelligence API")
+app = FastAPI(
+    title="SMC Smart Health Intelligence API",
+    default_response_class=ORJSONResponse,
+)
 
 # Initialize database (creates 'patient_transactions' table)
 init_db()
@@ -65,4 +69,5 @@ def root():
 if __name__ == "__main__":
     import uvicorn
     # Use standard uvicorn to support the WebSocket protocol in logs_router
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Small JSON frames: per-message deflate costs more CPU than it saves
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, ws_per_message_deflate=False)
\ No newline at end of file
@@ -9,7 +9,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
 from core.database import Base
@@ -29,8 +29,14 @@ class Facility(Base):
     district = Column(String, nullable=False, index=True)
     subdistrict = Column(String, nullable=False, index=True)
     ward = Column(String, nullable=False, index=True)
+    icu_capacity = Column(Integer, nullable=False, default=20, server_default=text("20"))  # Staffed ICU beds
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Covering index for ward -> facility_id lookups in the ward risk joins
+    __table_args__ = (
+        Index("ix_facility_ward_facility_id", "ward", "facility_id"),
+    )
+
     # Relationships
     health_records = relationship("HealthRecord", back_populates="facility", cascade="all, delete-orphan")
     status_records = relationship("FacilityStatus", back_populates="facility", cascade="all, delete-orphan")
@@ -66,6 +72,27 @@ class PatientTransaction(Base):
     month = Column(String, nullable=False, index=True)
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # Risk/prediction counts filter on type + time range and join on facility_id
+    __table_args__ = (
+        Index("ix_pt_type_ts_facility", "transaction_type", "timestamp", "facility_id"),
+        # Only CASE rows are ever counted; partial index keeps the hot range small
+        Index(
+            "ix_pt_case_ts_facility",
+            "timestamp",
+            "facility_id",
+            sqlite_where=text("transaction_type = 'CASE'"),
+            postgresql_where=text("transaction_type = 'CASE'"),
+        ),
+        # Append-only time series: a tiny BRIN index serves the rolling-window
+        # range scans on PostgreSQL (no BRIN on SQLite, so it is skipped there)
+        Index(
+            "ix_pt_ts_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Relationship
     facility = relationship("Facility", back_populates="health_records")
 
@@ -90,6 +117,11 @@ class FacilityStatus(Base):
     medicine_stock_status = Column(String, nullable=False)  # Adequate, Low, Critical
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # Latest-status-per-facility lookups (max timestamp per facility_id)
+    __table_args__ = (
+        Index("ix_facility_status_facility_ts", "facility_id", "timestamp"),
+    )
+
     # Relationship
     facility = relationship("Facility", back_populates="status_records")
 
@@ -105,7 +137,7 @@ class Ambulance(Base):
     id = Column(Integer, primary_key=True, index=True)
     vehicle_id = Column(String, unique=True, nullable=False, index=True)
     ward = Column(String, nullable=False, index=True)
-    status = Column(String, nullable=False, default="AVAILABLE")  # AVAILABLE, BUSY, OFFLINE
+    status = Column(String, nullable=False, default="AVAILABLE", index=True)  # AVAILABLE, BUSY, OFFLINE
     lat = Column(Float, nullable=False)
     lng = Column(Float, nullable=False)
     last_updated = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -150,21 +150,62 @@ class AmbulanceRepository(BaseRepository[Ambulance]):
             if max_distance_km and distance_km > max_distance_km:
                 continue
 
-            results.append({
-                "id": amb.id,
-                "vehicle_id": amb.vehicle_id,
-                "ward": amb.ward,
-                "status": amb.status,
-                "lat": amb.lat,
-                "lng": amb.lng,
-                "last_updated": amb.last_updated,
-                "distance_km": round(distance_km, 2),
-            })
+            results.append(self._with_distance(amb, distance_km))
 
         # Sort by distance and return top N
         results.sort(key=lambda x: x["distance_km"])
         return results[:limit]
 
+    def find_nearest_by_status(
+        self,
+        lat: float,
+        lng: float,
+        status: str,
+        limit: int = 3,
+        max_distance_km: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find nearest ambulances with a given status, filtered and ordered in SQL.
+
+        Same distance approximation as find_nearest, but the status filter,
+        ordering and LIMIT run in the database so only `limit` rows are loaded.
+
+        Args:
+            lat: Query latitude.
+            lng: Query longitude.
+            status: Status filter (AVAILABLE, BUSY, OFFLINE).
+            limit: Max results to return.
+            max_distance_km: Optional distance filter (rough km approximation).
+
+        Returns:
+            List of dicts with ambulance info and distance_km.
+        """
+        distance_sq = (Ambulance.lat - lat) * (Ambulance.lat - lat) + (Ambulance.lng - lng) * (Ambulance.lng - lng)
+
+        query = (
+            self.db.query(Ambulance, distance_sq.label("distance_sq"))
+            .filter(Ambulance.status == status)
+        )
+        if max_distance_km:
+            max_degrees = max_distance_km / 111
+            query = query.filter(distance_sq <= max_degrees * max_degrees)
+
+        rows = query.order_by(distance_sq).limit(limit).all()
+        return [self._with_distance(amb, math.sqrt(dist_sq) * 111) for amb, dist_sq in rows]
+
+    @staticmethod
+    def _with_distance(amb: Ambulance, distance_km: float) -> Dict[str, Any]:
+        """Serialize an ambulance together with its approximate distance."""
+        return {
+            "id": amb.id,
+            "vehicle_id": amb.vehicle_id,
+            "ward": amb.ward,
+            "status": amb.status,
+            "lat": amb.lat,
+            "lng": amb.lng,
+            "last_updated": amb.last_updated,
+            "distance_km": round(distance_km, 2),
+        }
+
     def count_by_status(self) -> Dict[str, int]:
         """Count ambulances by status.
 
@@ -6,7 +6,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from models.orm import Facility
 from repositories.base_repository import BaseRepository
@@ -66,6 +66,31 @@ class FacilityRepository(BaseRepository[Facility]):
             .all()
         )
 
+    def get_facility_ids(self, limit: int = 1000) -> List[str]:
+        """Fetch facility_id values only, without loading ORM instances.
+
+        Args:
+            limit: Max records.
+
+        Returns:
+            List of facility_id strings.
+        """
+        return list(self.db.execute(select(Facility.facility_id).limit(limit)).scalars())
+
+    def get_icu_capacities_by_ward(self, ward: str) -> Dict[str, int]:
+        """Map facility_id to icu_capacity for every facility in a ward.
+
+        Args:
+            ward: Ward name/code.
+
+        Returns:
+            Dict mapping facility_id to icu_capacity.
+        """
+        rows = self.db.execute(
+            select(Facility.facility_id, Facility.icu_capacity).where(Facility.ward == ward)
+        )
+        return dict(rows.all())
+
     def get_by_ward(self, ward: str, limit: int = 100) -> List[Facility]:
         """Fetch facilities in ward.
 
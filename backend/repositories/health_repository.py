@@ -118,4 +118,24 @@ class HealthRepository(BaseRepository[PatientTransaction]):
                 PatientTransaction.timestamp >= cutoff
             )
             .all()
-        )
\ No newline at end of file
+        )
+
+    def get_admission_counts_since(
+        self,
+        since: datetime,
+        facility_ids: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """
+        Count CASE events per facility since a cutoff in a single grouped query.
+        Batch counterpart of get_last_n_hours_by_facility for city-wide predictions.
+        """
+        query = (
+            self.db.query(PatientTransaction.facility_id, func.count(PatientTransaction.id))
+            .filter(
+                PatientTransaction.transaction_type == "CASE",
+                PatientTransaction.timestamp >= since
+            )
+        )
+        if facility_ids is not None:
+            query = query.filter(PatientTransaction.facility_id.in_(facility_ids))
+        return dict(query.group_by(PatientTransaction.facility_id).all())
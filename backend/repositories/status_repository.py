@@ -10,6 +10,7 @@ from sqlalchemy import func
 
 from models.orm import FacilityStatus, Facility
 from repositories.base_repository import BaseRepository
+from core.cache import ttl_cached
 
 
 class StatusRepository(BaseRepository[FacilityStatus]):
@@ -37,6 +38,39 @@ class StatusRepository(BaseRepository[FacilityStatus]):
             .first()
         )
 
+    def get_latest_for_facilities(
+        self, facility_ids: Optional[List[str]] = None
+    ) -> Dict[str, FacilityStatus]:
+        """Fetch most recent status record for many facilities in one query.
+
+        Args:
+            facility_ids: Facility identifiers (None for all facilities).
+
+        Returns:
+            Dict mapping facility_id to its latest FacilityStatus.
+        """
+        # ROW_NUMBER() picks exactly one latest row per facility (ties included)
+        ranked = self.db.query(
+            FacilityStatus.id.label("status_id"),
+            func.row_number()
+            .over(
+                partition_by=FacilityStatus.facility_id,
+                order_by=(FacilityStatus.timestamp.desc(), FacilityStatus.id.desc()),
+            )
+            .label("rn"),
+        )
+        if facility_ids is not None:
+            ranked = ranked.filter(FacilityStatus.facility_id.in_(facility_ids))
+        ranked = ranked.subquery()
+
+        results = (
+            self.db.query(FacilityStatus)
+            .join(ranked, FacilityStatus.id == ranked.c.status_id)
+            .filter(ranked.c.rn == 1)
+            .all()
+        )
+        return {r.facility_id: r for r in results}
+
     def get_recent_by_facility(
         self,
         facility_id: str,
@@ -65,6 +99,7 @@ class StatusRepository(BaseRepository[FacilityStatus]):
             .all()
         )
 
+    @ttl_cached("get_city_totals")
     def get_city_totals(self) -> Dict[str, int]:
         """Aggregate resource availability across all facilities.
 
@@ -7,7 +7,9 @@ GET /analytics/export-report - Download PDF executive report
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from datetime import datetime
@@ -56,8 +58,7 @@ def get_ward_risk_heatmap(db: Session = Depends(get_db)):
         Dict with all ward risks, sorted by risk_score desc.
     """
     service = WardRiskService(db)
-    risks = service.get_all_wards_risk()
-    return risks
+    return Response(content=service.get_all_wards_risk_json(), media_type="application/json")
 
 
 @router.get("/city-totals", tags=["Analytics"])
@@ -84,26 +85,32 @@ def get_ward_risk(ward: str, db: Session = Depends(get_db)):
 
 
 @router.get("/critical-wards", tags=["Analytics"])
-def get_critical_wards(db: Session = Depends(get_db)):
+def get_critical_wards(limit: Optional[int] = Query(None, ge=1), db: Session = Depends(get_db)):
     """Get wards in CRITICAL state.
 
+    Args:
+        limit: Optional cap on the number of (highest-risk) wards returned.
+
     Returns:
         List of critical wards.
     """
     service = WardRiskService(db)
-    wards = service.get_critical_wards()
+    wards = service.get_critical_wards(limit)
     return {"critical_wards": wards}
 
 
 @router.get("/high-risk-wards", tags=["Analytics"])
-def get_high_risk_wards(db: Session = Depends(get_db)):
+def get_high_risk_wards(limit: Optional[int] = Query(None, ge=1), db: Session = Depends(get_db)):
     """Get wards in HIGH or CRITICAL state.
 
+    Args:
+        limit: Optional cap on the number of (highest-risk) wards returned.
+
     Returns:
         List of high-risk wards.
     """
     service = WardRiskService(db)
-    wards = service.get_high_risk_wards()
+    wards = service.get_high_risk_wards(limit)
     return {"high_risk_wards": wards}
 
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from typing import Dict
-import asyncio
 
 from schemas.facility_status_schema import FacilityStatusPayload
 from services.facility_status_service import process_facility_status
@@ -11,21 +10,12 @@ from core.ws_manager import manager
 router = APIRouter()
 
 
-def _bg_broadcast(event: Dict) -> None:
-    """Schedule websocket broadcast in event loop."""
+async def _bg_broadcast(event: Dict) -> None:
+    """Broadcast on the server event loop (awaited by BackgroundTasks)."""
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        asyncio.create_task(manager.broadcast(event))
-    else:
-        # Fire-and-forget
-        try:
-            asyncio.run(manager.broadcast(event))
-        except Exception:
-            pass
+        await manager.broadcast(event)
+    except Exception:
+        pass
 
 
 @router.post("/", tags=["Facility Status"])
@@ -35,7 +25,7 @@ def ingest_facility_status(payload: FacilityStatusPayload, background_tasks: Bac
     Returns ingestion acknowledgment, crisis flag and city totals.
     """
     try:
-        result = process_facility_status(payload.dict())
+        result = process_facility_status(payload.model_dump())
     except Exception as exc:
         raise HTTPException(status_code=422, detail=str(exc))
 
@@ -10,16 +10,19 @@ from core.ws_manager import manager
 
 router = APIRouter(tags=["Ingest: Clinical Events"])
 
-def _bg_broadcast_patient_event(payload: Dict[str, Any]) -> None:
-    import asyncio
-    async def _broadcast():
+# Per-request strings built from precomputed templates / lookups
+_PATIENT_MSG_TMPL = "Patient %s recorded in %s"
+_EVENT_TYPES = {"CASE": "patient_case", "VACCINATION": "patient_vaccination"}
+
+async def _bg_broadcast_patient_event(event_type: str, payload: Dict[str, Any]) -> None:
+    # Coroutine task: Starlette awaits it on the server loop instead of
+    # spinning up a fresh event loop per ingested event.
+    try:
         await manager.broadcast({
-            "type": f"patient_{payload['transaction_type'].lower()}",
+            "type": event_type,
             "timestamp": datetime.utcnow().isoformat(),
             "payload": payload
         })
-    try:
-        asyncio.run(_broadcast())
     except Exception: pass
 
 @router.post("/", response_model=HealthIngestResponse)
@@ -30,21 +33,25 @@ async def ingest_patient_transaction(
 ) -> HealthIngestResponse:
     """Register a live clinical event (CASE or VACCINATION)."""
     try:
-        # Pass the validated Pydantic dict directly to the service
-        event_dict = payload.dict()
+        # Dump once (JSON-safe) and reuse it for the response and broadcast
+        event_dict = payload.model_dump(mode="json")
+        facility_id = event_dict["facility_id"]
+        tx_type = event_dict["transaction_type"]
+        dept = event_dict["department"]
         
-        result = process_ingest(db, event_dict)
+        # Already validated by FastAPI; the service uses the model as-is
+        result = process_ingest(db, payload)
         
         if result["status"] == "failed":
             raise Exception(result.get("error"))
 
-        background_tasks.add_task(_bg_broadcast_patient_event, event_dict)
+        background_tasks.add_task(_bg_broadcast_patient_event, _EVENT_TYPES[tx_type], event_dict)
         
         return HealthIngestResponse(
             status="ingested",
             outbreak_detected=result.get("outbreak_detected", False),
-            message=f"Patient {payload.transaction_type} recorded in {payload.department}",
-            facility_id=payload.facility_id
+            message=_PATIENT_MSG_TMPL % (tx_type, dept),
+            facility_id=facility_id
         )
         
     except Exception as e:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from models.risk_engine import compute_risk
 
 router = APIRouter()
@@ -7,4 +7,5 @@ router = APIRouter()
 def get_risk_by_district():
     data = compute_risk()
 
-    return data.to_dict(orient="records")
+    # pandas serializes straight to JSON, skipping the list-of-dicts round trip
+    return Response(content=data.to_json(orient="records"), media_type="application/json")
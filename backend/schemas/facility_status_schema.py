@@ -3,16 +3,19 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class FacilityStatusPayload(BaseModel):
     """Pydantic model for facility status ingestion.
 
     Validates and normalizes incoming facility capacity reports.
+    Plain string fields are stripped by ``str_strip_whitespace``.
     """
 
-    facility_id: str = Field(..., description="Unique facility identifier")
+    model_config = ConfigDict(str_strip_whitespace=True, use_enum_values=True)
+
+    facility_id: str = Field(..., min_length=1, description="Unique facility identifier")
     facility_type: Literal["Hospital", "Lab", "PHC", "Private"]
     district: str
     subdistrict: str
@@ -27,28 +30,10 @@ class FacilityStatusPayload(BaseModel):
 
     timestamp: datetime
 
-    @validator("facility_id", pre=True, always=True)
-    def strip_facility_id(cls, v: str) -> str:
-        if v is None:
-            raise ValueError("facility_id must not be empty")
-        v2 = v.strip()
-        if not v2:
-            raise ValueError("facility_id must not be empty")
-        return v2
-
-    @validator("facility_type", "district", "subdistrict", "ward", "medicine_stock_status", pre=True, each_item=False)
-    def strip_strings(cls, v: str) -> str:
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
-    @validator("timestamp", pre=True)
-    def parse_timestamp(cls, v):
+    @field_validator("facility_type", "medicine_stock_status", "timestamp", mode="before")
+    @classmethod
+    def strip_non_str_fields(cls, v):
+        # Literal and datetime fields are not covered by str_strip_whitespace
         if isinstance(v, str):
-            # let pydantic parse ISO timestamps, but ensure stripping
             return v.strip()
         return v
-
-    class Config:
-        str_strip_whitespace = True
-        use_enum_values = True
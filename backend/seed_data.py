@@ -28,29 +28,33 @@ def seed_appointment_test_data():
 
         # 2. Seed 'Live' Load for HSP123 Orthopedics (CRISIS: 12/10 Load)
         print("\n[2/3] Seeding high load (12 patients) for HSP123 Orthopedics...")
-        for _ in range(12):
-            tx = PatientTransaction(
-                facility_id="HSP123",
-                transaction_type="CASE",
-                department="Orthopedics",
-                indicator_name="Bone Fracture",
-                month="Feb",
-                timestamp=datetime.utcnow() - timedelta(minutes=15)
-            )
-            db.add(tx)
+        ortho_ts = datetime.utcnow() - timedelta(minutes=15)
+        db.bulk_insert_mappings(PatientTransaction, [
+            {
+                "facility_id": "HSP123",
+                "transaction_type": "CASE",
+                "department": "Orthopedics",
+                "indicator_name": "Bone Fracture",
+                "month": "Feb",
+                "timestamp": ortho_ts,
+            }
+            for _ in range(12)
+        ])
 
         # 3. Seed 'Normal' Load for HSP123 Neurology (NORMAL: 2/5 Load)
         print("[3/3] Seeding normal load (2 patients) for HSP123 Neurology...")
-        for _ in range(2):
-            tx = PatientTransaction(
-                facility_id="HSP123",
-                transaction_type="CASE",
-                department="Neurology",
-                indicator_name="Consultation",
-                month="Feb",
-                timestamp=datetime.utcnow() - timedelta(hours=1)
-            )
-            db.add(tx)
+        neuro_ts = datetime.utcnow() - timedelta(hours=1)
+        db.bulk_insert_mappings(PatientTransaction, [
+            {
+                "facility_id": "HSP123",
+                "transaction_type": "CASE",
+                "department": "Neurology",
+                "indicator_name": "Consultation",
+                "month": "Feb",
+                "timestamp": neuro_ts,
+            }
+            for _ in range(2)
+        ])
 
         db.commit()
         print("\n" + "=" * 60)
@@ -127,10 +127,13 @@ class AmbulanceService:
         Returns:
             List of nearest available ambulances.
         """
-        all_nearest = self.find_nearest(lat, lng, limit * 2)  # Get more, filter available
-
-        available = [a for a in all_nearest if a["status"] == "AVAILABLE"]
-        return available[:limit]
+        return self.ambulance_repo.find_nearest_by_status(
+            lat=lat,
+            lng=lng,
+            status="AVAILABLE",
+            limit=limit,
+            max_distance_km=50.0,
+        )
 
     def get_fleet_status(self) -> Dict[str, Any]:
         """Get fleet-wide status summary.
@@ -6,6 +6,16 @@ FACILITY_METADATA = {
     }
 }
 
+# Total Capacity per department: (Doctors * Hours * 60 mins) / slot_mins
+# Static metadata, so this is computed once at import.
+FACILITY_TOTAL_SLOTS = {
+    fid: {
+        dept: (info["doctors"] * info["hours"] * 60) // info["slot_mins"]
+        for dept, info in depts.items()
+    }
+    for fid, depts in FACILITY_METADATA.items()
+}
+
 def get_specialty_availability(facility_id: str, requested_dept: str, current_cases: int):
     """
     LOGIC EXPLANATION:
@@ -13,14 +23,11 @@ def get_specialty_availability(facility_id: str, requested_dept: str, current_ca
     2. We take the 'Real-time Load' (total_cases) from the latest ingestion.
     3. Available Slots = Total Theoretical Slots - Current Busy Patients.
     """
-    facility = FACILITY_METADATA.get(facility_id)
+    facility = FACILITY_TOTAL_SLOTS.get(facility_id)
     if not facility or requested_dept not in facility:
         return {"status": "Unknown", "message": "Department not found at this facility"}
 
-    dept_info = facility[requested_dept]
-    
-    # Calculate Total Capacity: (Doctors * Hours * 60 mins) / slot_mins
-    total_slots = (dept_info["doctors"] * dept_info["hours"] * 60) // dept_info["slot_mins"]
+    total_slots = facility[requested_dept]
     
     # Calculate Remaining Capacity
     available_now = total_slots - current_cases
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
+from datetime import date, datetime
 from pathlib import Path
 import csv
 import fcntl
+import os
 
 from schemas.facility_status_schema import FacilityStatusPayload
 from core.ws_manager import manager
@@ -11,30 +13,40 @@ from core.ws_manager import manager
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
-CSV_PATH = DATA_DIR / "facility_status.csv"
+# Latest row per facility, rewritten on every report; totals are computed from it
+SNAPSHOT_PATH = DATA_DIR / "facility_status_latest.csv"
+# Snapshot is swapped in with os.replace, so lock a sidecar file instead of it
+SNAPSHOT_LOCK_PATH = DATA_DIR / ".facility_status_latest.lock"
+
+HEADERS = [
+    "facility_id",
+    "facility_type",
+    "district",
+    "subdistrict",
+    "ward",
+    "beds_available",
+    "icu_available",
+    "ventilators_available",
+    "oxygen_units_available",
+    "medicine_stock_status",
+    "timestamp",
+]
+
+
+def _partition_path(day: Optional[date] = None) -> Path:
+    """History is partitioned per UTC day: facility_status_YYYY-MM-DD.csv."""
+    day = day or datetime.utcnow().date()
+    return DATA_DIR / f"facility_status_{day.isoformat()}.csv"
 
 
 def _ensure_csv_headers(path: Path) -> None:
     """Create CSV with headers if missing."""
     if not path.exists():
-        headers = [
-            "facility_id",
-            "facility_type",
-            "district",
-            "subdistrict",
-            "ward",
-            "beds_available",
-            "icu_available",
-            "ventilators_available",
-            "oxygen_units_available",
-            "medicine_stock_status",
-            "timestamp",
-        ]
         with path.open("w", newline="", encoding="utf-8") as fh:
             # exclusive lock while creating
             fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
             writer = csv.writer(fh)
-            writer.writerow(headers)
+            writer.writerow(HEADERS)
             fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
 
 
@@ -43,47 +55,55 @@ def _append_record(path: Path, record: Dict[str, Any]) -> None:
     with path.open("a", newline="", encoding="utf-8") as fh:
         fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
         writer = csv.writer(fh)
-        writer.writerow([
-            record.get("facility_id"),
-            record.get("facility_type"),
-            record.get("district"),
-            record.get("subdistrict"),
-            record.get("ward"),
-            record.get("beds_available"),
-            record.get("icu_available"),
-            record.get("ventilators_available"),
-            record.get("oxygen_units_available"),
-            record.get("medicine_stock_status"),
-            record.get("timestamp"),
-        ])
+        writer.writerow([record.get(field) for field in HEADERS])
         fh.flush()
         fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
 
 
-def _compute_totals(path: Path) -> Dict[str, int]:
-    """Read CSV and compute totals for numeric resources."""
+def _update_snapshot(record: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Replace this facility's row in the latest-status snapshot.
+
+    The snapshot holds one row per facility, so the rewrite is O(facilities)
+    no matter how much history has accumulated. Returns the updated rows.
+    """
+    with SNAPSHOT_LOCK_PATH.open("a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            rows: Dict[str, Dict[str, Any]] = {}
+            if SNAPSHOT_PATH.exists():
+                with SNAPSHOT_PATH.open("r", newline="", encoding="utf-8") as fh:
+                    for row in csv.DictReader(fh):
+                        rows[row["facility_id"]] = row
+            rows[record["facility_id"]] = {field: record.get(field) for field in HEADERS}
+
+            tmp_path = SNAPSHOT_PATH.with_suffix(".csv.tmp")
+            with tmp_path.open("w", newline="", encoding="utf-8") as fh:
+                writer = csv.DictWriter(fh, fieldnames=HEADERS)
+                writer.writeheader()
+                writer.writerows(rows.values())
+            os.replace(tmp_path, SNAPSHOT_PATH)
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+    return rows
+
+
+def _compute_totals(rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Compute city totals from the latest status row of each facility."""
     totals = {
         "total_beds": 0,
         "total_icu": 0,
         "total_ventilators": 0,
         "total_oxygen": 0,
     }
-    if not path.exists():
-        return totals
-
-    with path.open("r", newline="", encoding="utf-8") as fh:
-        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
-        reader = csv.DictReader(fh)
-        for row in reader:
-            try:
-                totals["total_beds"] += int(row.get("beds_available") or 0)
-                totals["total_icu"] += int(row.get("icu_available") or 0)
-                totals["total_ventilators"] += int(row.get("ventilators_available") or 0)
-                totals["total_oxygen"] += int(row.get("oxygen_units_available") or 0)
-            except Exception:
-                # skip malformed rows
-                continue
-        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    for row in rows:
+        try:
+            totals["total_beds"] += int(row.get("beds_available") or 0)
+            totals["total_icu"] += int(row.get("icu_available") or 0)
+            totals["total_ventilators"] += int(row.get("ventilators_available") or 0)
+            totals["total_oxygen"] += int(row.get("oxygen_units_available") or 0)
+        except Exception:
+            # skip malformed rows
+            continue
 
     return totals
 
@@ -100,17 +120,18 @@ def process_facility_status(payload: Dict[str, Any]) -> Dict[str, Any]:
     # Validate using schema
     validated = FacilityStatusPayload(**payload)
 
-    # Ensure CSV exists with headers
-    _ensure_csv_headers(CSV_PATH)
+    # Ensure today's partition exists with headers
+    csv_path = _partition_path()
+    _ensure_csv_headers(csv_path)
 
     # Append record
-    record = validated.dict()
+    record = validated.model_dump()
     # Convert timestamp to ISO string for CSV
     record["timestamp"] = record["timestamp"].isoformat()
-    _append_record(CSV_PATH, record)
+    _append_record(csv_path, record)
 
-    # Compute totals across all facilities
-    totals = _compute_totals(CSV_PATH)
+    # Compute totals across all facilities from their latest status
+    totals = _compute_totals(_update_snapshot(record).values())
 
     # Detect resource crisis
     crisis = False
@@ -1,5 +1,8 @@
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Tuple, Union
+from collections import deque
+import threading
 from datetime import datetime
+import orjson
 from models.schemas import PatientTransactionSchema
 from models.orm import PatientTransaction
 from core.data_access import make_csv_accessor, CSVDataAccess
@@ -17,20 +20,63 @@ FIELDNAMES = [
     "ingestion_timestamp",
 ]
 
+_FIELDNAMES_SET = set(FIELDNAMES)
+
 ingested_store: CSVDataAccess = make_csv_accessor("patient_events", FIELDNAMES)
 failed_store: CSVDataAccess = make_csv_accessor("failed_patient_events", FIELDNAMES)
 
-def process_ingest(db, payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Processes individual clinical events for live analytics."""
+# Sliding window of the latest rows fed to the outbreak engine, seeded once
+# from the audit CSV instead of re-reading the file on every ingest
+OUTBREAK_WINDOW = 50
+_outbreak_window: deque = deque(reversed(ingested_store.read_last(OUTBREAK_WINDOW)), maxlen=OUTBREAK_WINDOW)
+
+# Pre-serialized /logs payloads keyed by (store, n) and tagged with the
+# store's write counter; an entry is only served while its tag is current
+_json_lock = threading.Lock()
+_json_versions: Dict[str, int] = {"recent": 0, "failed": 0}
+_json_cache: Dict[Tuple[str, int], Tuple[int, bytes]] = {}
+
+
+def _bump_json_version(kind: str) -> None:
+    with _json_lock:
+        _json_versions[kind] += 1
+
+
+def _cached_json(kind: str, n: int, read: Callable[[int], List[Dict[str, Any]]]) -> bytes:
+    """Serve or rebuild the JSON for read(n), tagged with the write counter.
+
+    The counter is read before the store, so a payload built concurrently
+    with a write is returned but never cached under the newer version.
+    """
+    with _json_lock:
+        version = _json_versions[kind]
+        entry = _json_cache.get((kind, n))
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    payload = orjson.dumps(read(n))
+    with _json_lock:
+        if _json_versions[kind] == version:
+            _json_cache[(kind, n)] = (version, payload)
+    return payload
+
+
+def process_ingest(db, payload: Union[PatientTransactionSchema, Dict[str, Any]]) -> Dict[str, Any]:
+    """Processes individual clinical events for live analytics.
+
+    Accepts the schema instance FastAPI already validated (used as-is) or a
+    raw dict, which is validated here. The event is committed on the
+    request's session before it is reported as ingested.
+    """
+    # One clock read per event, shared by the success and failure paths
+    ingestion_dt = datetime.utcnow()
     try:
-        # 1. Validate clinical data via Schema
-        # We exclude ingestion_timestamp from the schema validation to avoid crashes
-        rec = PatientTransactionSchema(**payload)
+        # 1. Validate clinical data via Schema (skipped if already validated)
+        if isinstance(payload, PatientTransactionSchema):
+            rec = payload
+        else:
+            rec = PatientTransactionSchema.model_validate(payload)
         
-        # 2. Capture the exact moment of ingestion for the audit log
-        ingestion_dt = datetime.utcnow()
-        
-        # 3. SQL Persistence: Specialty-Aware tracking
+        # 2. SQL Persistence: Specialty-Aware tracking
         new_event = PatientTransaction(
             facility_id=rec.facility_id,
             transaction_type=rec.transaction_type,
@@ -43,14 +89,16 @@ def process_ingest(db, payload: Dict[str, Any]) -> Dict[str, Any]:
         db.add(new_event)
         db.commit()
 
-        # 4. CSV Persistence: Audit trail for Outbreak Engine
-        row = rec.dict()
-        row["timestamp"] = row["timestamp"].isoformat() if row["timestamp"] else ""
+        # 3. CSV Persistence: Audit trail for Outbreak Engine
+        # Single pydantic-core pass; mode="json" renders timestamp as ISO text
+        row = rec.model_dump(include=_FIELDNAMES_SET, mode="json")
         row["ingestion_timestamp"] = ingestion_dt.isoformat()
         ingested_store.append(row)
+        _outbreak_window.append(row)
+        _bump_json_version("recent")
 
-        # 5. Live Outbreak Detection
-        outbreak = detect_outbreaks(ingested_store, row)
+        # 4. Live Outbreak Detection
+        outbreak = detect_outbreaks(_outbreak_window, row)
 
         return {
             "status": "ingested", 
@@ -61,15 +109,28 @@ def process_ingest(db, payload: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:
         db.rollback()
+        if isinstance(payload, PatientTransactionSchema):
+            facility_id = payload.facility_id
+        else:
+            facility_id = payload.get("facility_id", "UNKNOWN")
         failed_store.append({
-            "facility_id": payload.get("facility_id", "UNKNOWN"),
-            "ingestion_timestamp": datetime.utcnow().isoformat(),
+            "facility_id": facility_id,
+            "ingestion_timestamp": ingestion_dt.isoformat(),
             "indicator_name": f"Error: {str(e)}"
         })
+        _bump_json_version("failed")
         return {"status": "failed", "error": str(e)}
 
 def get_recent(n: int = 50):
     return ingested_store.read_last(n)
 
 def get_failed(n: int = 50):
-    return failed_store.read_last(n)
\ No newline at end of file
+    return failed_store.read_last(n)
+
+def get_recent_json(n: int = 50) -> bytes:
+    """JSON bytes for get_recent(n), rebuilt only after a new ingest."""
+    return _cached_json("recent", n, get_recent)
+
+def get_failed_json(n: int = 50) -> bytes:
+    """JSON bytes for get_failed(n), rebuilt only after a new failure."""
+    return _cached_json("failed", n, get_failed)
@@ -10,8 +10,12 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 import math
 
+import numpy as np
+
 from repositories.health_repository import HealthRepository
 from repositories.status_repository import StatusRepository
+from repositories.facility_repository import FacilityRepository
+from core.cache import ttl_cached
 
 
 class PredictionService:
@@ -31,21 +35,16 @@ class PredictionService:
             return default
         return round(value, 1)
 
-    def predict_bed_demand(self, facility_id: str) -> Dict[str, Any]:
-        """Predict bed demand using sanitized transaction counts."""
-        last_6h_records = self.health_repo.get_last_n_hours_by_facility(
-            facility_id=facility_id,
-            hours=6,
-        )
-
-        # Basic admission rate calculation
-        total_admissions = len(last_6h_records) if last_6h_records else 0
+    def _compute_prediction(
+        self,
+        facility_id: str,
+        total_admissions: int,
+        latest_status: Optional[Any],
+    ) -> Dict[str, Any]:
+        """Bed demand arithmetic over pre-fetched admission count and status."""
         avg_admission_rate = total_admissions / 6.0
         projected_24h = int(avg_admission_rate * 24)
 
-        # Get current bed capacity
-        latest_status = self.status_repo.get_latest_by_facility(facility_id)
-        
         # DEFAULT VALUES IF NO DATA
         beds_available = latest_status.beds_available if latest_status else 0
         
@@ -67,18 +66,16 @@ class PredictionService:
             "crisis_likely": bool(crisis_likely),
         }
 
-    def predict_icu_demand(self, facility_id: str) -> Dict[str, Any]:
-        """Predict ICU bed demand using sanitized transaction counts."""
-        last_6h_records = self.health_repo.get_last_n_hours_by_facility(
-            facility_id=facility_id,
-            hours=6,
-        )
-
-        total_admissions = len(last_6h_records) if last_6h_records else 0
+    def _compute_icu_prediction(
+        self,
+        facility_id: str,
+        total_admissions: int,
+        latest_status: Optional[Any],
+    ) -> Dict[str, Any]:
+        """ICU demand arithmetic over pre-fetched admission count and status."""
         avg_admission_rate = total_admissions / 6.0
         projected_24h = int(avg_admission_rate * 24)
 
-        latest_status = self.status_repo.get_latest_by_facility(facility_id)
         icu_available = latest_status.icu_available if latest_status else 0
 
         if avg_admission_rate <= 0:
@@ -98,20 +95,82 @@ class PredictionService:
             "crisis_likely": bool(crisis_likely),
         }
 
+    def predict_both(self, facility_id: str) -> Dict[str, Any]:
+        """Predict bed and ICU demand from one shared set of lookups."""
+        cutoff = datetime.utcnow() - timedelta(hours=6)
+        total_admissions = self.health_repo.get_admission_counts_since(
+            cutoff, [facility_id]
+        ).get(facility_id, 0)
+
+        # With no recent admissions capacity doesn't affect the result
+        # (999h remaining, no crisis), so skip the status lookup
+        latest_status = (
+            self.status_repo.get_latest_by_facility(facility_id)
+            if total_admissions
+            else None
+        )
+
+        return {
+            "bed": self._compute_prediction(facility_id, total_admissions, latest_status),
+            "icu": self._compute_icu_prediction(facility_id, total_admissions, latest_status),
+        }
+
+    def predict_bed_demand(self, facility_id: str) -> Dict[str, Any]:
+        """Predict bed demand using sanitized transaction counts."""
+        return self.predict_both(facility_id)["bed"]
+
+    def predict_icu_demand(self, facility_id: str) -> Dict[str, Any]:
+        """Predict ICU bed demand using sanitized transaction counts."""
+        return self.predict_both(facility_id)["icu"]
+
+    @ttl_cached("predict_all_facilities")
     def predict_all_facilities(self) -> Dict[str, Any]:
         """Fetch predictions for all facilities."""
-        from repositories.facility_repository import FacilityRepository
         facility_repo = FacilityRepository(self.db)
-        facilities = facility_repo.get_all(limit=1000)
-
-        predictions = []
-        total_crisis_count = 0
+        facility_ids = facility_repo.get_facility_ids(limit=1000)
+
+        # Two batched queries instead of two per facility
+        cutoff = datetime.utcnow() - timedelta(hours=6)
+        admission_counts = self.health_repo.get_admission_counts_since(cutoff, facility_ids)
+        # Only facilities with recent admissions need their capacity
+        active_ids = [fid for fid in facility_ids if admission_counts.get(fid)]
+        latest_statuses = self.status_repo.get_latest_for_facilities(active_ids) if active_ids else {}
+
+        # Same arithmetic as _compute_prediction, in one NumPy pass over all facilities
+        n = len(facility_ids)
+        counts = np.fromiter((admission_counts.get(fid, 0) for fid in facility_ids), dtype=np.float64, count=n)
+        beds = np.fromiter(
+            (
+                (latest_statuses[fid].beds_available or 0) if fid in latest_statuses else 0
+                for fid in facility_ids
+            ),
+            dtype=np.float64,
+            count=n,
+        )
 
-        for facility in facilities:
-            pred = self.predict_bed_demand(facility.facility_id)
-            predictions.append(pred)
-            if pred["crisis_likely"]:
-                total_crisis_count += 1
+        rates = counts / 6.0
+        projected = (rates * 24).astype(np.int64)
+        active = rates > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Safety margin: 1.2x
+            hours = np.where(active, beds / (rates * 1.2), 999.0)
+        crisis = active & (hours < 24)
+        hours = np.where(np.isfinite(hours), hours, 999.0)
+
+        # Builtin round on the Python floats: np.round differs on halfway cases
+        predictions = [
+            {
+                "facility_id": fid,
+                "avg_admission_rate": round(rate, 2),
+                "projected_24h_admissions": proj,
+                "beds_remaining_hours": round(hrs, 1),
+                "crisis_likely": flag,
+            }
+            for fid, rate, proj, hrs, flag in zip(
+                facility_ids, rates.tolist(), projected.tolist(), hours.tolist(), crisis.tolist()
+            )
+        ]
+        total_crisis_count = int(crisis.sum())
 
         return {
             "timestamp": datetime.utcnow().isoformat(),
@@ -7,6 +7,7 @@ Uses fpdf2 for lightweight, pure-Python PDF generation.
 from __future__ import annotations
 
 import io
+from collections import Counter
 from datetime import datetime
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
@@ -20,6 +21,32 @@ from services.ward_risk_service import WardRiskService
 from services.ambulance_service import AmbulanceService
 
 
+# Static report copy, built once at import rather than on every request
+EXECUTIVE_SUMMARY_TEXT = (
+    'This report provides a comprehensive overview of Solapur Municipal Corporation\'s '
+    'health system status. It includes resource availability, facility utilization '
+    'forecasts, and ward-level risk assessments to support operational decision-making.'
+)
+
+RECOMMENDATIONS = (
+    '- Prioritize resource allocation to facilities with crisis projections within 24 hours',
+    '- Deploy additional ambulances to CRITICAL and HIGH risk wards for rapid response',
+    '- Coordinate bed transfers between stable facilities and those in crisis',
+    '- Activate surge capacity protocols if ICU pressure exceeds 80%',
+    '- Implement 6-hourly status monitoring for facilities trending toward crisis',
+    '- Maintain oxygen and ventilator inventory margins of 15% above peak consumption',
+)
+
+FOOTER_NOTE_TEXT = (
+    'This report is generated automatically from live health system data. '
+    'All metrics are based on latest facility submissions as of report generation time. '
+    'For detailed facility analysis, consult the interactive dashboard.'
+)
+
+CRISIS_TABLE_HEADERS = ['Facility ID', 'Projected 24h Cases', 'Beds Remaining (hrs)']
+WARD_TABLE_HEADERS = ['Ward', 'Risk Level', 'Risk Score', 'ICU Pressure']
+
+
 class SolapurHealthReportPDF(FPDF):
     """Custom PDF class for SMC Health Report with headers and footers."""
 
@@ -30,6 +57,8 @@ class SolapurHealthReportPDF(FPDF):
         self.heading_font_size = 12
         self.normal_font_size = 10
         self.small_font_size = 8
+        # Stamped once per document; footer() runs on every page
+        self.generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def header(self):
         """Add header to each page."""
@@ -43,7 +72,7 @@ class SolapurHealthReportPDF(FPDF):
         """Add footer to each page."""
         self.set_y(-15)
         self.set_font('Helvetica', 'I', 8)
-        self.cell(0, 10, f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Page {self.page_no()}', 0, 0, 'C')
+        self.cell(0, 10, f'Generated: {self.generated_at} | Page {self.page_no()}', 0, 0, 'C')
 
     def section_title(self, title: str):
         """Add section title with formatting."""
@@ -102,6 +131,15 @@ class ReportService:
         self.ward_risk_service = WardRiskService(db)
         self.ambulance_service = AmbulanceService(db)
 
+    def _get_or_compute_predictions(self) -> Dict[str, Dict[str, Any]]:
+        """City-wide bed predictions keyed by facility_id.
+
+        Backed by the TTL-cached predict_all_facilities, so summary and
+        per-facility reports inside the same window share one computation.
+        """
+        predictions = self.prediction_service.predict_all_facilities()
+        return {p['facility_id']: p for p in predictions.get('predictions', [])}
+
     def generate_summary_pdf(self) -> bytes:
         """Generate comprehensive health system executive report.
 
@@ -121,12 +159,7 @@ class ReportService:
         # ==== EXECUTIVE SUMMARY ====
         pdf.section_title('Executive Summary')
         pdf.set_font('Helvetica', '', 10)
-        pdf.multi_cell(
-            0, 5,
-            'This report provides a comprehensive overview of Solapur Municipal Corporation\'s '
-            'health system status. It includes resource availability, facility utilization '
-            'forecasts, and ward-level risk assessments to support operational decision-making.'
-        )
+        pdf.multi_cell(0, 5, EXECUTIVE_SUMMARY_TEXT)
         pdf.ln(3)
 
         # ==== CITY TOTALS ====
@@ -159,7 +192,6 @@ class ReportService:
             pdf.ln(2)
             
             if crisis_facilities:
-                headers = ['Facility ID', 'Projected 24h Cases', 'Beds Remaining (hrs)']
                 rows = [
                     [
                         p.get('facility_id', 'N/A')[:20],
@@ -168,7 +200,7 @@ class ReportService:
                     ]
                     for p in crisis_facilities[:5]  # Top 5 crisis facilities
                 ]
-                pdf.add_table(headers, rows, col_widths=[60, 60, 70])
+                pdf.add_table(CRISIS_TABLE_HEADERS, rows, col_widths=[60, 60, 70])
         except Exception as e:
             pdf.set_font('Helvetica', '', 9)
             pdf.cell(0, 8, f'[Unable to process predictions: {str(e)[:50]}]', 0, 1)
@@ -181,11 +213,10 @@ class ReportService:
             wards_data = ward_risks.get('wards', [])
             
             # Risk distribution summary
+            level_counts = Counter(w.get('risk_level') for w in wards_data)
             risk_counts = {
-                'CRITICAL': len([w for w in wards_data if w.get('risk_level') == 'CRITICAL']),
-                'HIGH': len([w for w in wards_data if w.get('risk_level') == 'HIGH']),
-                'MEDIUM': len([w for w in wards_data if w.get('risk_level') == 'MEDIUM']),
-                'LOW': len([w for w in wards_data if w.get('risk_level') == 'LOW']),
+                level: level_counts[level]
+                for level in ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
             }
             
             pdf.set_font('Helvetica', '', 10)
@@ -197,7 +228,6 @@ class ReportService:
             # Top critical wards table
             critical_high = [w for w in wards_data if w.get('risk_level') in ['CRITICAL', 'HIGH']]
             if critical_high:
-                headers = ['Ward', 'Risk Level', 'Risk Score', 'ICU Pressure']
                 rows = [
                     [
                         w.get('ward', 'N/A')[:15],
@@ -207,7 +237,7 @@ class ReportService:
                     ]
                     for w in critical_high[:8]
                 ]
-                pdf.add_table(headers, rows, col_widths=[45, 35, 50, 60])
+                pdf.add_table(WARD_TABLE_HEADERS, rows, col_widths=[45, 35, 50, 60])
         except Exception as e:
             pdf.set_font('Helvetica', '', 9)
             pdf.cell(0, 8, f'[Unable to process ward risks: {str(e)[:50]}]', 0, 1)
@@ -218,10 +248,7 @@ class ReportService:
         try:
             all_ambulances = self.ambulance_repo.get_all()
             if all_ambulances:
-                status_counts = {}
-                for amb in all_ambulances:
-                    status = amb.status if hasattr(amb, 'status') else 'AVAILABLE'
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                status_counts = Counter(getattr(amb, 'status', 'AVAILABLE') for amb in all_ambulances)
                 
                 pdf.set_font('Helvetica', '', 10)
                 pdf.cell(0, 8, f'Total Ambulances: {len(all_ambulances)}', 0, 1)
@@ -240,17 +267,8 @@ class ReportService:
         pdf.add_page()
         pdf.section_title('Risk Mitigation Recommendations')
         pdf.set_font('Helvetica', '', 10)
-        
-        recommendations = [
-            '- Prioritize resource allocation to facilities with crisis projections within 24 hours',
-            '- Deploy additional ambulances to CRITICAL and HIGH risk wards for rapid response',
-            '- Coordinate bed transfers between stable facilities and those in crisis',
-            '- Activate surge capacity protocols if ICU pressure exceeds 80%',
-            '- Implement 6-hourly status monitoring for facilities trending toward crisis',
-            '- Maintain oxygen and ventilator inventory margins of 15% above peak consumption',
-        ]
-        
-        for rec in recommendations:
+
+        for rec in RECOMMENDATIONS:
             pdf.multi_cell(0, 6, rec)
             pdf.ln(1)
 
@@ -258,12 +276,7 @@ class ReportService:
         pdf.ln(5)
         pdf.set_font('Helvetica', 'I', 8)
         pdf.set_text_color(100, 100, 100)
-        pdf.multi_cell(
-            0, 4,
-            'This report is generated automatically from live health system data. '
-            'All metrics are based on latest facility submissions as of report generation time. '
-            'For detailed facility analysis, consult the interactive dashboard.'
-        )
+        pdf.multi_cell(0, 4, FOOTER_NOTE_TEXT)
 
         # Return PDF as bytes
         return pdf.output()
@@ -303,7 +316,9 @@ class ReportService:
         # Bed Demand Prediction
         pdf.section_title('Bed Demand Forecast')
         try:
-            prediction = self.prediction_service.predict_bed_demand(facility_id)
+            prediction = self._get_or_compute_predictions().get(facility_id)
+            if prediction is None:
+                prediction = self.prediction_service.predict_bed_demand(facility_id)
             pdf.add_metric('Avg Admission Rate', f"{prediction.get('avg_admission_rate', 0):.2f}", 'cases/hour')
             pdf.add_metric('24h Projection', prediction.get('projected_24h_admissions', 0), 'cases')
             pdf.add_metric('Crisis Likely', 'Yes' if prediction.get('crisis_likely') else 'No', '')
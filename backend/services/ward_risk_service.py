@@ -5,10 +5,14 @@ UPDATED: Now uses individual PatientTransaction counting for live risk scoring.
 
 from __future__ import annotations
 
-from typing import Dict, List, Any
+from bisect import bisect_right
+from itertools import islice, takewhile
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
+
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, select, and_, cast, Float
 
 # ########################################################################
 # HUGE CHANGE: IMPORT PATIENTTRANSACTION INSTEAD OF HEALTHRECORD
@@ -16,6 +20,62 @@ from sqlalchemy import func
 from models.orm import PatientTransaction, FacilityStatus, Facility
 from repositories.status_repository import StatusRepository
 from repositories.facility_repository import FacilityRepository
+from core.cache import swr_cached
+
+# Rolling case windows, allocated once instead of per query
+WINDOW_24H = timedelta(hours=24)
+WINDOW_6H = timedelta(hours=6)
+
+# Risk bands: a score at or above THRESHOLDS[i] is at least LEVELS[i + 1]
+LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+THRESHOLDS = (25, 50, 75)
+
+# Serialized heatmap for the current cached result: (result dict, JSON bytes)
+_heatmap_json: Tuple[Optional[Dict[str, Any]], bytes] = (None, b"")
+
+
+def _icu_pressure(facilities: Iterable[Tuple[int, Optional[FacilityStatus]]]) -> float:
+    """ICU pressure from (icu_capacity, latest status) of each facility in a ward."""
+    total_icu_capacity = 0
+    total_icu_available = 0
+
+    for icu_capacity, latest_status in facilities:
+        if latest_status:
+            total_icu_capacity += icu_capacity
+            total_icu_available += latest_status.icu_available
+
+    if total_icu_capacity == 0: return 0.0
+    pressure = (total_icu_capacity - total_icu_available) / total_icu_capacity
+    return max(0.0, min(1.0, pressure))
+
+
+def _score_ward(ward: str, cases_24h: int, cases_6h: int, icu_pressure: float) -> Dict[str, Any]:
+    """Compute risk score (0-100) from pre-fetched ward metrics."""
+    # Normalization (adjusted for individual patient velocity)
+    # Assume > 200 individual cases in 24h for a single ward is critical
+    cases_normalized = min(100.0, (cases_24h / 200.0) * 100.0)
+
+    growth_rate = 0.0
+    growth_normalized = 0.0
+    if cases_24h > 0:
+        growth_rate = cases_6h / (cases_24h / 4.0)
+        growth_normalized = min(100.0, (growth_rate / 1.5) * 100.0)
+
+    icu_normalized = icu_pressure * 100.0
+
+    risk_score = (cases_normalized * 0.5 + growth_normalized * 0.3 + icu_normalized * 0.2)
+
+    risk_level = LEVELS[bisect_right(THRESHOLDS, risk_score)]
+
+    # KEEP THESE KEYS SAME FOR FRONTEND COMPATIBILITY
+    return {
+        "ward": ward,
+        "risk_score": round(risk_score, 1),
+        "risk_level": risk_level,
+        "recent_cases": cases_24h, # Frontend uses this for Heatmap labels
+        "icu_pressure": round(icu_pressure, 3),
+        "growth_rate": round(growth_rate, 2),
+    }
 
 
 class WardRiskService:
@@ -29,101 +89,200 @@ class WardRiskService:
         self.status_repo = StatusRepository(db)
         self.facility_repo = FacilityRepository(db)
 
-    def get_ward_cases_24h(self, ward: str) -> int:
-        """Count individual 'CASE' transactions in ward over last 24 hours."""
-        # ########################################################################
-        # LOGIC CHANGE: SUM() -> COUNT()
-        # We count the rows where transaction_type is 'CASE'.
-        # ########################################################################
-        result = (
-            self.db.query(func.count(PatientTransaction.id))
-            .join(Facility, Facility.facility_id == PatientTransaction.facility_id)
-            .filter(
-                Facility.ward == ward,
-                PatientTransaction.transaction_type == "CASE",
-                PatientTransaction.timestamp >= datetime.utcnow() - timedelta(hours=24),
-            )
-            .scalar()
+    def _case_window_columns(self, cutoff_6h: datetime):
+        """COUNT over the 24h window plus a conditional 6h SUM, for one scan."""
+        return (
+            func.count(PatientTransaction.id),
+            func.sum(case((PatientTransaction.timestamp >= cutoff_6h, 1), else_=0)),
         )
-        return result or 0
 
-    def get_ward_cases_6h(self, ward: str) -> int:
-        """Count individual 'CASE' transactions in ward over last 6 hours."""
-        result = (
-            self.db.query(func.count(PatientTransaction.id))
+    def get_ward_case_windows(self, ward: str) -> Tuple[int, int]:
+        """Count 'CASE' transactions in ward over the last 24h and 6h in one query."""
+        now = datetime.utcnow()
+        cases_24h, cases_6h = (
+            self.db.query(*self._case_window_columns(now - WINDOW_6H))
             .join(Facility, Facility.facility_id == PatientTransaction.facility_id)
             .filter(
                 Facility.ward == ward,
                 PatientTransaction.transaction_type == "CASE",
-                PatientTransaction.timestamp >= datetime.utcnow() - timedelta(hours=6),
+                PatientTransaction.timestamp >= now - WINDOW_24H,
             )
-            .scalar()
+            .one()
         )
-        return result or 0
+        return cases_24h or 0, cases_6h or 0
 
     def get_ward_icu_pressure(self, ward: str) -> float:
         """Calculate ICU pressure for ward (Stays same - based on FacilityStatus)."""
-        facilities = self.db.query(Facility).filter(Facility.ward == ward).all()
-        if not facilities: return 0.0
-
-        total_icu_capacity = 0
-        total_icu_available = 0
+        capacities = self.facility_repo.get_icu_capacities_by_ward(ward)
+        if not capacities: return 0.0
 
-        for facility in facilities:
-            latest_status = self.status_repo.get_latest_by_facility(facility.facility_id)
-            if latest_status:
-                total_icu_capacity += 20 # Baseline baseline
-                total_icu_available += latest_status.icu_available
-
-        if total_icu_capacity == 0: return 0.0
-        pressure = (total_icu_capacity - total_icu_available) / total_icu_capacity
-        return max(0.0, min(1.0, pressure))
+        # One windowed query for the latest status of every facility in the ward
+        latest_statuses = self.status_repo.get_latest_for_facilities(list(capacities))
+        return _icu_pressure((cap, latest_statuses.get(fid)) for fid, cap in capacities.items())
 
     def compute_ward_risk(self, ward: str) -> Dict[str, Any]:
         """Compute risk score (0-100) using count-based data."""
-        cases_24h = self.get_ward_cases_24h(ward)
-        cases_6h = self.get_ward_cases_6h(ward)
+        cases_24h, cases_6h = self.get_ward_case_windows(ward)
         icu_pressure = self.get_ward_icu_pressure(ward)
+        return _score_ward(ward, cases_24h, cases_6h, icu_pressure)
+
+    def _ward_risk_select(self, now: datetime):
+        """One analytical query scoring every ward, highest risk first.
+
+        Mirrors _score_ward/_icu_pressure in SQL: per-ward 24h/6h case
+        windows, ICU pressure from each facility's latest status, the
+        weighted score and its risk level.
+        """
+        pt = PatientTransaction
 
-        # Normalization (adjusted for individual patient velocity)
-        # Assume > 200 individual cases in 24h for a single ward is critical
-        cases_normalized = min(100.0, (cases_24h / 200.0) * 100.0)
+        wards = (
+            select(Facility.ward.label("ward"))
+            .where(Facility.ward.isnot(None), Facility.ward != "")
+            .distinct()
+            .subquery("wards")
+        )
 
-        growth_rate = 0.0
-        growth_normalized = 0.0
-        if cases_24h > 0:
-            growth_rate = cases_6h / (cases_24h / 4.0)
-            growth_normalized = min(100.0, (growth_rate / 1.5) * 100.0)
+        cases = (
+            select(Facility.ward.label("ward"), *(
+                col.label(name)
+                for col, name in zip(self._case_window_columns(now - WINDOW_6H), ("c24", "c6"))
+            ))
+            .select_from(pt)
+            .join(Facility, Facility.facility_id == pt.facility_id)
+            .where(pt.transaction_type == "CASE", pt.timestamp >= now - WINDOW_24H)
+            .group_by(Facility.ward)
+            .subquery("cases")
+        )
 
-        icu_normalized = icu_pressure * 100.0
+        ranked = (
+            select(
+                FacilityStatus.facility_id,
+                FacilityStatus.icu_available,
+                func.row_number()
+                .over(
+                    partition_by=FacilityStatus.facility_id,
+                    order_by=(FacilityStatus.timestamp.desc(), FacilityStatus.id.desc()),
+                )
+                .label("rn"),
+            )
+            .subquery("ranked")
+        )
+        icu = (
+            select(
+                Facility.ward.label("ward"),
+                func.sum(Facility.icu_capacity).label("capacity"),
+                func.sum(ranked.c.icu_available).label("available"),
+            )
+            .select_from(Facility)
+            .join(ranked, and_(ranked.c.facility_id == Facility.facility_id, ranked.c.rn == 1))
+            .group_by(Facility.ward)
+            .subquery("icu")
+        )
 
-        risk_score = (cases_normalized * 0.5 + growth_normalized * 0.3 + icu_normalized * 0.2)
+        c24 = cast(func.coalesce(cases.c.c24, 0), Float)
+        c6 = cast(func.coalesce(cases.c.c6, 0), Float)
+        capacity = cast(func.coalesce(icu.c.capacity, 0), Float)
+        available = cast(func.coalesce(icu.c.available, 0), Float)
 
-        if risk_score >= 75: risk_level = "CRITICAL"
-        elif risk_score >= 50: risk_level = "HIGH"
-        elif risk_score >= 25: risk_level = "MEDIUM"
-        else: risk_level = "LOW"
+        raw_pressure = (capacity - available) / capacity
+        icu_pressure = case(
+            (capacity == 0, 0.0),
+            (raw_pressure < 0, 0.0),
+            (raw_pressure > 1, 1.0),
+            else_=raw_pressure,
+        )
+        cases_scaled = (c24 / 200.0) * 100.0
+        cases_normalized = case((cases_scaled > 100.0, 100.0), else_=cases_scaled)
+        growth_rate = case((c24 > 0, c6 / (c24 / 4.0)), else_=0.0)
+        growth_scaled = (growth_rate / 1.5) * 100.0
+        growth_normalized = case(
+            (c24 == 0, 0.0),
+            (growth_scaled > 100.0, 100.0),
+            else_=growth_scaled,
+        )
 
-        # KEEP THESE KEYS SAME FOR FRONTEND COMPATIBILITY
-        return {
-            "ward": ward,
-            "risk_score": round(risk_score, 1),
-            "risk_level": risk_level,
-            "recent_cases": cases_24h, # Frontend uses this for Heatmap labels
-            "icu_pressure": round(icu_pressure, 3),
-            "growth_rate": round(growth_rate, 2),
-        }
+        scored = (
+            select(
+                wards.c.ward,
+                func.coalesce(cases.c.c24, 0).label("recent_cases"),
+                icu_pressure.label("icu_pressure"),
+                growth_rate.label("growth_rate"),
+                (
+                    cases_normalized * 0.5
+                    + growth_normalized * 0.3
+                    + (icu_pressure * 100.0) * 0.2
+                ).label("risk_score"),
+            )
+            .select_from(wards)
+            .outerjoin(cases, cases.c.ward == wards.c.ward)
+            .outerjoin(icu, icu.c.ward == wards.c.ward)
+            .subquery("scored")
+        )
+
+        risk_level = case(
+            *(
+                (scored.c.risk_score >= threshold, level)
+                for threshold, level in reversed(list(zip(THRESHOLDS, LEVELS[1:])))
+            ),
+            else_=LEVELS[0],
+        )
+        return (
+            select(scored, risk_level.label("risk_level"))
+            .order_by(scored.c.risk_score.desc(), scored.c.ward)
+        )
 
+    @swr_cached("get_all_wards_risk", ttl=30, stale_ttl=300)
     def get_all_wards_risk(self) -> Dict[str, Any]:
         """Fetch risk for all wards for the GIS Heatmap."""
-        wards = self.db.query(Facility.ward).distinct().all()
-        risks = [self.compute_ward_risk(w[0]) for w in wards if w[0]]
-        risks.sort(key=lambda x: x["risk_score"], reverse=True)
+        # Scored and sorted in the database; only rounding happens here
+        now = datetime.utcnow()
+        rows = self.db.execute(self._ward_risk_select(now)).mappings().all()
+
+        # KEEP THESE KEYS SAME FOR FRONTEND COMPATIBILITY
+        risks = [
+            {
+                "ward": row["ward"],
+                "risk_score": round(row["risk_score"], 1),
+                "risk_level": row["risk_level"],
+                "recent_cases": row["recent_cases"],
+                "icu_pressure": round(row["icu_pressure"], 3),
+                "growth_rate": round(row["growth_rate"], 2),
+            }
+            for row in rows
+        ]
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "total_wards": len(risks),
             "critical_count": sum(1 for r in risks if r["risk_level"] == "CRITICAL"),
             "high_count": sum(1 for r in risks if r["risk_level"] == "HIGH"),
             "wards": risks,
-        }
\ No newline at end of file
+        }
+
+    def _wards_at_or_above(self, min_level: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Wards of the cached heatmap at `min_level` or worse, at most `limit`.
+
+        The heatmap is sorted by risk_score desc, so the matches are a prefix:
+        the scan stops at the first ward below `min_level` or after `limit`.
+        """
+        levels = set(LEVELS[LEVELS.index(min_level):])
+        wards = self.get_all_wards_risk()["wards"]
+        return list(islice(takewhile(lambda r: r["risk_level"] in levels, wards), limit))
+
+    def get_critical_wards(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Wards currently in CRITICAL state, highest risk first."""
+        return self._wards_at_or_above("CRITICAL", limit)
+
+    def get_high_risk_wards(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Wards currently in HIGH or CRITICAL state, highest risk first."""
+        return self._wards_at_or_above("HIGH", limit)
+
+    def get_all_wards_risk_json(self) -> bytes:
+        """Heatmap as JSON bytes, serialized once per cached result."""
+        global _heatmap_json
+        result = self.get_all_wards_risk()
+        cached_result, payload = _heatmap_json
+        if cached_result is not result:
+            payload = orjson.dumps(result)
+            _heatmap_json = (result, payload)
+        return payload
@@ -22,19 +22,19 @@ def trigger_appointment_block():
         print(f"[1/2] Injecting 15 active cases into {dept} at {facility_id}...")
         now = datetime.utcnow()
         
-        for i in range(15):
-            # Spread transactions over the last 30 minutes
-            timestamp = now - timedelta(minutes=i*2)
-            
-            tx = PatientTransaction(
-                facility_id=facility_id,
-                transaction_type="CASE",
-                department=dept,
-                indicator_name="Emergency Fracture",
-                month="Feb",
-                timestamp=timestamp
-            )
-            db.add(tx)
+        # Spread transactions over the last 30 minutes, inserted in one batch
+        db.bulk_insert_mappings(PatientTransaction, [
+            {
+                "facility_id": facility_id,
+                "transaction_type": "CASE",
+                "department": dept,
+                "indicator_name": "Emergency Fracture",
+                "count": 1,
+                "month": "Feb",
+                "timestamp": now - timedelta(minutes=i*2),
+            }
+            for i in range(15)
+        ])
         
         db.commit()
         print(f"✓ Injected 15 individual patient transactions.")
@@ -21,22 +21,20 @@ def trigger_ward_b_outbreak():
         # This spikes the velocity (count) that WardRiskService now looks for
         print("\n[2/4] Injecting 300 individual Dengue transactions...")
         now = datetime.utcnow()
-        for i in range(300):
-            # Spread transactions across the last 3 hours to spike growth_rate
-            seconds_ago = i * 36 
-            timestamp = now - timedelta(seconds=seconds_ago)
-            
-            # Using our new individual patient model
-            tx = PatientTransaction(
-                facility_id=ward_b_fac.facility_id,
-                transaction_type="CASE",
-                department="General Medicine",
-                indicator_name="Dengue",
-                count=1,
-                month="Feb",
-                timestamp=timestamp
-            )
-            db.add(tx)
+        # Spread transactions across the last 3 hours to spike growth_rate;
+        # one bulk INSERT instead of 300 tracked ORM objects
+        db.bulk_insert_mappings(PatientTransaction, [
+            {
+                "facility_id": ward_b_fac.facility_id,
+                "transaction_type": "CASE",
+                "department": "General Medicine",
+                "indicator_name": "Dengue",
+                "count": 1,
+                "month": "Feb",
+                "timestamp": now - timedelta(seconds=i * 36),
+            }
+            for i in range(300)
+        ])
         
         db.commit()
         
@@ -24,18 +24,18 @@ def trigger_hsp002_crisis():
         # PredictionService will see a high 'admissions per hour' count
         print("\n[2/3] Streaming 100 patient admissions...")
         now = datetime.utcnow()
-        for i in range(100):
-            timestamp = now - timedelta(minutes=i)
-            tx = PatientTransaction(
-                facility_id="HSP002",
-                transaction_type="CASE",
-                department="Emergency",
-                indicator_name="Acute Respiratory Distress",
-                count=1,
-                month="Feb",
-                timestamp=timestamp
-            )
-            db.add(tx)
+        db.bulk_insert_mappings(PatientTransaction, [
+            {
+                "facility_id": "HSP002",
+                "transaction_type": "CASE",
+                "department": "Emergency",
+                "indicator_name": "Acute Respiratory Distress",
+                "count": 1,
+                "month": "Feb",
+                "timestamp": now - timedelta(minutes=i),
+            }
+            for i in range(100)
+        ])
         
         db.commit()
 
@@ -1,9 +1,16 @@
+import argparse
 import requests
 import time
-import pandas as pd
+
+import orjson
 
 API_URL = "http://localhost:8000/ingestion/ingest"
 
+# One keep-alive connection for the whole stream instead of a socket per POST
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+SESSION.headers["Content-Type"] = "application/json"  # bodies are pre-encoded with orjson
+
 # Sample data rows you provided
 data = [
     ["Maharashtra",27,"Solapur",496,"Malshiras",4250,"2021-2022","May","1.3.1","New cases of PW with hypertension detected","M1 [Ante Natal Care (ANC)]",5,0,5,0,"22-04-2025"],
@@ -26,18 +33,30 @@ columns = [
     "reportedvalueforurban", "datagovupdatedate"
 ]
 
-def run_simulation():
-    df = pd.DataFrame(data, columns=columns)
+STREAM_INTERVAL = 2.0  # seconds between the start of consecutive entries
+
+
+def run_simulation(throttle: bool = True):
     print("🚀 Starting Data Stream Simulation...")
     
-    for _, row in df.iterrows():
-        payload = row.to_dict()
-        response = requests.post(API_URL, json=payload)
+    # Fixed-rate pacing: each entry is due STREAM_INTERVAL after the previous
+    # one started, so request latency is absorbed into the wait, not added to it
+    next_send = time.monotonic()
+    for row in data:
+        if throttle:
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_send += STREAM_INTERVAL
+        payload = dict(zip(columns, row))
+        response = SESSION.post(API_URL, data=orjson.dumps(payload))
         if response.status_code == 200:
             print(f"✅ Ingested: {payload['indicatorname']} for {payload['subdistrict']}")
         else:
             print(f"❌ Failed: {response.text}")
-        time.sleep(2) # 2-second delay between entries
 
 if __name__ == "__main__":
-    run_simulation()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Stream sample health records to the ingest API.")
+    parser.add_argument("--no-throttle", action="store_true", help="send entries back-to-back (benchmarking)")
+    args = parser.parse_args()
+    run_simulation(throttle=not args.no_throttle)
@@ -5,4 +5,4 @@ python3 seed_data.py
 
 # 2. Start the FastAPI server
 echo "🚀 Starting CityHealth 360 API..."
-uvicorn main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+uvicorn main:app --host 0.0.0.0 --port 8000 --ws-per-message-deflate false
\ No newline at end of file
@@ -6,9 +6,16 @@ with different capitalization, spacing, or punctuation.
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import Dict
 
 
+# Separator cleanup patterns, compiled once for the per-row hot path
+_SEP_RE = re.compile(r'[-_]+')
+_WS_RE = re.compile(r'\s+')
+
+
 # Standard mapping dictionary for similar indicator names
 # Maps various input strings to a canonical standard form
 INDICATOR_MAPPING = {
@@ -93,6 +100,30 @@ INDICATOR_MAPPING = {
 }
 
 
+# Canonical names become grouping keys downstream; intern them so equal
+# labels are one shared object and dict/groupby comparisons hit the identity fast path
+INDICATOR_MAPPING = {key: sys.intern(canonical) for key, canonical in INDICATOR_MAPPING.items()}
+
+
+def _unshadowed_keys(mapping: Dict[str, str]) -> tuple:
+    """(key, canonical) pairs a first-match substring scan can actually return.
+
+    A key containing an earlier key (e.g. 'malaria cases' after 'malaria')
+    can never be the first hit, so it is dropped from the scan.
+    """
+    kept = []
+    for key, canonical_form in mapping.items():
+        if not any(earlier in key for earlier, _ in kept):
+            kept.append((key, canonical_form))
+    return tuple(kept)
+
+
+_MATCH_KEYS = _unshadowed_keys(INDICATOR_MAPPING)
+
+# Mortality keywords; any other disease keyword is itself a mapping key
+_DEATH_TOKENS = ('death', 'mortality')
+
+
 def normalize_indicator_name(indicator_name: str) -> str:
     """Normalize indicator name for consistent aggregation.
     
@@ -115,35 +146,36 @@ def normalize_indicator_name(indicator_name: str) -> str:
         'new Malaria CASES' -> 'New Malaria Cases'
         'TB-Cases' -> 'Tuberculosis Cases'
     """
+    # Non-string cells (None, NaN, lists from messy frames) may be unhashable,
+    # so only strings go through the memoized path
     if not indicator_name or not isinstance(indicator_name, str):
         return indicator_name or "Unknown"
-    
+    return _normalize_str(indicator_name)
+
+
+# Indicator names repeat heavily across rows; memoize per distinct string
+@lru_cache(maxsize=4096)
+def _normalize_str(indicator_name: str) -> str:
+    """normalize_indicator_name for a non-empty string."""
     # Step 1: Convert to lowercase for comparison
     normalized = indicator_name.lower().strip()
     
     # Step 2: Replace hyphens, underscores, and extra spaces with single space
-    normalized = re.sub(r'[-_]+', ' ', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _SEP_RE.sub(' ', normalized)
+    normalized = _WS_RE.sub(' ', normalized)
     
     # Step 3: Look up in mapping dictionary
-    # Check for exact match or partial match for disease keywords
-    for key, canonical_form in INDICATOR_MAPPING.items():
-        if normalized == key or key in normalized:
+    # Exact match is a single hash lookup; otherwise partial match for disease keywords
+    canonical_form = INDICATOR_MAPPING.get(normalized)
+    if canonical_form is not None:
+        return canonical_form
+    for key, canonical_form in _MATCH_KEYS:
+        if key in normalized:
             return canonical_form
     
-    # Step 4: If no exact match, try to identify disease keywords and standardize
-    # Extract disease keywords and capitalize properly
-    diseases = ['malaria', 'dengue', 'tuberculosis', 'tb', 'diarrhea', 'hiv', 
-                'hepatitis', 'measles', 'pneumonia', 'encephalitis', 'cholera', 
-                'influenza', 'flu', 'death', 'mortality']
-    
-    for disease in diseases:
-        if disease in normalized:
-            # Convert first letter of disease to uppercase + "Cases" suffix
-            disease_title = disease.replace('tb', 'TB').title().replace('hiv', 'HIV')
-            if 'death' in normalized or 'mortality' in normalized:
-                return 'Deaths'
-            return f'{disease_title} Cases'
+    # Step 4: Mortality indicators not covered by the mapping
+    if any(token in normalized for token in _DEATH_TOKENS):
+        return 'Deaths'
     
     # Step 5: If still no match, return original indicator name
     # (but with consistent capitalization and spacing)
@@ -161,10 +193,21 @@ def normalize_disease_names(df, column_name: str = 'indicatorname') -> None:
         None (modifies DataFrame in-place)
         
     Example:
-        >>> health_df['indicatorname'] = health_df['indicatorname'].apply(normalize_indicator_name)
+        >>> normalize_disease_names(health_df, 'indicatorname')
+        >>> # same as, but each distinct name is normalized once:
+        >>> lookup = {v: normalize_indicator_name(v) for v in health_df['indicatorname'].unique()}
+        >>> health_df['indicatorname'] = health_df['indicatorname'].map(lookup)
     """
     if column_name in df.columns:
-        df[column_name] = df[column_name].apply(normalize_indicator_name)
+        # Normalize each distinct value once, then map the column in one pass
+        column = df[column_name]
+        try:
+            lookup = {value: normalize_indicator_name(value) for value in column.unique()}
+        except TypeError:
+            # Unhashable cells (e.g. lists) cannot be deduplicated; go row by row
+            df[column_name] = column.apply(normalize_indicator_name)
+            return
+        df[column_name] = column.map(lookup)
 
 
 def get_indicator_mapping_reference() -> Dict[str, str]:
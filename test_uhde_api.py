@@ -4,10 +4,13 @@ Test script for UHDE Health Ingest Endpoints
 Demonstrates how to use the API and validates functionality.
 """
 
-import requests
-import json
+import asyncio
+import socket
+import httpx
+import orjson
 from datetime import datetime
 import time
+from urllib.parse import urlsplit
 
 BASE_URL = "http://localhost:8000"
 
@@ -78,8 +81,14 @@ AMBULANCE_RECORDS = [
 ]
 
 
-def test_endpoint(endpoint: str, records: list, name: str):
+async def test_endpoint(client: httpx.AsyncClient, endpoint: str, records: list, name: str):
     """Test an ingest endpoint with sample records."""
+    # All records are in flight at once; results are reported in order below
+    responses = await asyncio.gather(
+        *(client.post(f"{endpoint}/", content=orjson.dumps(record)) for record in records),
+        return_exceptions=True,
+    )
+
     print(f"\n{'='*70}")
     print(f"Testing: {name}")
     print(f"{'='*70}")
@@ -87,19 +96,15 @@ def test_endpoint(endpoint: str, records: list, name: str):
     success_count = 0
     error_count = 0
     
-    for i, record in enumerate(records, 1):
+    for i, (record, response) in enumerate(zip(records, responses), 1):
         try:
             print(f"\n[{i}/{len(records)}] Sending record...")
             print(f"  Source: {record['source_name']}")
             print(f"  Indicator: {record['indicatorname']}")
             print(f"  Cases: {record['total_cases']}")
             
-            # Make POST request
-            response = requests.post(
-                f"{BASE_URL}{endpoint}/",
-                json=record,
-                timeout=10
-            )
+            if isinstance(response, Exception):
+                raise response
             
             # Check response status
             if response.status_code == 200:
@@ -129,7 +134,7 @@ def test_endpoint(endpoint: str, records: list, name: str):
     return success_count, error_count
 
 
-def test_validation_errors():
+async def test_validation_errors(client: httpx.AsyncClient):
     """Test invalid payloads to verify validation."""
     print(f"\n{'='*70}")
     print("Testing: Validation Error Handling")
@@ -175,15 +180,16 @@ def test_validation_errors():
     ]
     
     validation_passed = 0
+    responses = await asyncio.gather(
+        *(client.post("/ingest/hospital/", content=orjson.dumps(payload)) for _, payload in invalid_records),
+        return_exceptions=True,
+    )
     
-    for desc, payload in invalid_records:
+    for (desc, payload), response in zip(invalid_records, responses):
         print(f"\n[{desc}]")
         try:
-            response = requests.post(
-                f"{BASE_URL}/ingest/hospital/",
-                json=payload,
-                timeout=10
-            )
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 422:
                 print(f"  ✓ Correctly rejected with 422")
@@ -199,7 +205,7 @@ def test_validation_errors():
     return validation_passed
 
 
-def test_health_checks():
+async def test_health_checks(client: httpx.AsyncClient):
     """Test health check endpoints."""
     print(f"\n{'='*70}")
     print("Testing: Health Check Endpoints")
@@ -213,11 +219,16 @@ def test_health_checks():
     ]
     
     health_ok = 0
+    responses = await asyncio.gather(
+        *(client.get(endpoint) for endpoint in endpoints),
+        return_exceptions=True,
+    )
     
-    for endpoint in endpoints:
+    for endpoint, response in zip(endpoints, responses):
         try:
             print(f"\nChecking {endpoint}...")
-            response = requests.get(f"{BASE_URL}{endpoint}", timeout=10)
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 data = response.json()
@@ -235,7 +246,7 @@ def test_health_checks():
     return health_ok
 
 
-def test_logs_endpoints():
+async def test_logs_endpoints(client: httpx.AsyncClient):
     """Test logs endpoints."""
     print(f"\n{'='*70}")
     print("Testing: Logs Endpoints")
@@ -243,7 +254,7 @@ def test_logs_endpoints():
     
     try:
         print("\n[GET /logs/recent]")
-        response = requests.get(f"{BASE_URL}/logs/recent", timeout=10)
+        response = await client.get("/logs/recent")
         
         if response.status_code == 200:
             data = response.json()
@@ -258,6 +269,14 @@ def test_logs_endpoints():
         print(f"  ✗ Exception: {str(e)}")
 
 
+def server_ready() -> bool:
+    """TCP probe: True once something accepts connections on BASE_URL."""
+    url = urlsplit(BASE_URL)
+    with socket.socket() as sock:
+        sock.settimeout(0.1)
+        return sock.connect_ex((url.hostname, url.port or 80)) == 0
+
+
 def print_summary(total_success, total_error):
     """Print final test summary."""
     print(f"\n{'='*70}")
@@ -272,6 +291,30 @@ def print_summary(total_success, total_error):
         print(f"\n⚠️  Some tests failed. Review the output above.")
 
 
+async def run_checks():
+    """Run the ingest, validation, health and logs checks over one async client."""
+    # Request bodies are pre-encoded with orjson, so declare the JSON type once
+    headers = {"Content-Type": "application/json"}
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10, headers=headers) as client:
+        results = await asyncio.gather(
+            test_endpoint(client, "/ingest/hospital", HOSPITAL_RECORDS, "Hospital Ingest"),
+            test_endpoint(client, "/ingest/lab", LAB_RECORDS, "Lab Ingest"),
+            test_endpoint(client, "/ingest/phc", PHC_RECORDS, "PHC Ingest"),
+            test_endpoint(client, "/ingest/ambulance", AMBULANCE_RECORDS, "Ambulance Ingest"),
+        )
+        
+        # Test validation
+        await test_validation_errors(client)
+        
+        # Test health checks
+        await test_health_checks(client)
+        
+        # Test logs
+        await test_logs_endpoints(client)
+    
+    return results
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*70)
@@ -280,49 +323,24 @@ def main():
     print(f"Base URL: {BASE_URL}")
     print(f"Timestamp: {datetime.utcnow().isoformat()}")
     
-    # Wait for server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            requests.get(f"{BASE_URL}/", timeout=2)
-            break
-        except requests.exceptions.ConnectionError:
-            if attempt < max_retries - 1:
-                print(f"\nWaiting for server... (attempt {attempt+1}/{max_retries})")
-                time.sleep(1)
-            else:
+    # Wait for server to be ready (up to 5s, probing every 0.1s)
+    deadline = time.monotonic() + 5
+    if not server_ready():
+        print("\nWaiting for server...")
+        while not server_ready():
+            if time.monotonic() >= deadline:
                 print("\n✗ Cannot connect to server. Is it running on localhost:8000?")
                 print("  Start with: python3 main.py")
                 return
+            time.sleep(0.1)
     
     total_success = 0
     total_error = 0
     
-    # Test each endpoint
-    s, e = test_endpoint("/ingest/hospital", HOSPITAL_RECORDS, "Hospital Ingest")
-    total_success += s
-    total_error += e
-    
-    s, e = test_endpoint("/ingest/lab", LAB_RECORDS, "Lab Ingest")
-    total_success += s
-    total_error += e
-    
-    s, e = test_endpoint("/ingest/phc", PHC_RECORDS, "PHC Ingest")
-    total_success += s
-    total_error += e
-    
-    s, e = test_endpoint("/ingest/ambulance", AMBULANCE_RECORDS, "Ambulance Ingest")
-    total_success += s
-    total_error += e
-    
-    # Test validation
-    test_validation_errors()
-    
-    # Test health checks
-    test_health_checks()
-    
-    # Test logs
-    test_logs_endpoints()
+    # Test each endpoint concurrently, then validation, health and logs
+    for s, e in asyncio.run(run_checks()):
+        total_success += s
+        total_error += e
     
     # Summary
     print_summary(total_success, total_error)
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core import cache
+from core.database import Base
+import models.orm  # noqa: F401  (registers the tables on Base.metadata)
+
+
+@pytest.fixture()
+def memory_db():
+    """Session on a fresh in-memory SQLite database, with empty caches."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    cache._cache.clear()
+    cache._swr_entries.clear()
+    yield session
+    cache._cache.clear()
+    cache._swr_entries.clear()
+    session.close()
+    engine.dispose()
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from models.orm import Ambulance
+from repositories.ambulance_repository import AmbulanceRepository
+from services.ambulance_service import AmbulanceService
+
+
+ORIGIN = (17.66, 75.90)
+STATUSES = ("AVAILABLE", "BUSY", "OFFLINE")
+
+
+@pytest.fixture()
+def repo(memory_db):
+    # 40 ambulances at distinct distances (about 2.4 km apart, the farthest
+    # past the 50 km cap), inserted in shuffled order
+    ambulances = [
+        Ambulance(
+            vehicle_id=f"AMB{i:02d}", ward=f"Ward-{i % 5}", status=STATUSES[i % 7 % 3],
+            lat=ORIGIN[0] + i * 0.016, lng=ORIGIN[1] - i * 0.014,
+        )
+        for i in range(40)
+    ]
+    random.Random(7).shuffle(ambulances)
+    memory_db.add_all(ambulances)
+    memory_db.commit()
+    return AmbulanceRepository(memory_db)
+
+
+def python_search(repo, status, limit, max_distance_km):
+    """The original search: score every ambulance in Python, then filter."""
+    nearest = repo.find_nearest(*ORIGIN, limit=1000, max_distance_km=max_distance_km)
+    return [a for a in nearest if a["status"] == status][:limit]
+
+
+@pytest.mark.parametrize("status", STATUSES)
+@pytest.mark.parametrize("limit", [1, 3, 100])
+@pytest.mark.parametrize("max_distance_km", [None, 50.0, 10.0])
+def test_find_nearest_by_status_matches_python_search(repo, status, limit, max_distance_km):
+    result = repo.find_nearest_by_status(*ORIGIN, status=status, limit=limit, max_distance_km=max_distance_km)
+
+    assert result == python_search(repo, status, limit, max_distance_km)
+
+
+def test_status_cap_order_and_limit(repo):
+    result = repo.find_nearest_by_status(*ORIGIN, status="AVAILABLE", limit=100, max_distance_km=50.0)
+    distances = [a["distance_km"] for a in result]
+
+    assert result
+    assert {a["status"] for a in result} == {"AVAILABLE"}
+    assert distances == sorted(distances)
+    assert max(distances) <= 50.0
+    assert len(repo.find_nearest_by_status(*ORIGIN, status="AVAILABLE", limit=2)) == 2
+
+
+def test_find_nearest_available_uses_the_50_km_cap(repo, memory_db):
+    result = AmbulanceService(memory_db).find_nearest_available(*ORIGIN, limit=100)
+
+    assert result == python_search(repo, "AVAILABLE", 100, 50.0)
@@ -0,0 +1,117 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core import cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=fake.monotonic))
+    cache._cache.clear()
+    cache._swr_entries.clear()
+    cache._swr_refreshing.clear()
+    yield fake
+    cache._cache.clear()
+    cache._swr_entries.clear()
+    cache._swr_refreshing.clear()
+
+
+class Counter:
+    """Returns 1, 2, 3, ... on successive computations."""
+
+    calls = 0
+
+    def __init__(self, gate=None, started=None):
+        self.gate = gate
+        self.started = started
+
+    @cache.swr_cached("test_counter", ttl=30, stale_ttl=300)
+    def value(self):
+        if self.started is not None:
+            self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        Counter.calls += 1
+        return Counter.calls
+
+    @cache.ttl_cached("test_ttl_counter")
+    def ttl_value(self):
+        Counter.calls += 1
+        return Counter.calls
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    Counter.calls = 0
+
+
+def test_ttl_cached_shares_one_value_across_instances(clock):
+    assert Counter().ttl_value() == 1
+    assert Counter().ttl_value() == 1
+    assert Counter.calls == 1
+
+
+def test_ttl_cached_rejects_arguments(clock):
+    with pytest.raises(TypeError):
+        Counter().ttl_value("other-key")
+
+
+def test_swr_fresh_value_is_served_without_recomputing(clock):
+    assert Counter().value() == 1
+    clock.now += 29
+    assert Counter().value() == 1
+    assert Counter.calls == 1
+
+
+def test_swr_stale_value_is_served_while_one_refresh_runs(clock):
+    assert Counter().value() == 1
+    clock.now += 31
+
+    gate, started = threading.Event(), threading.Event()
+    results = []
+    refresher = threading.Thread(target=lambda: results.append(Counter(gate, started).value()))
+    refresher.start()
+    assert started.wait(5)
+
+    # while the first caller recomputes, everyone else gets the stale value
+    assert [Counter(gate).value() for _ in range(3)] == [1, 1, 1]
+
+    gate.set()
+    refresher.join(5)
+    assert results == [2]
+    assert Counter.calls == 2
+    assert cache._swr_refreshing == set()
+    assert Counter().value() == 2
+
+
+def test_swr_entry_expires_after_stale_ttl(clock):
+    assert Counter().value() == 1
+    clock.now += 301
+    assert Counter().value() == 2
+    assert Counter.calls == 2
+
+
+def test_swr_failed_refresh_keeps_stale_value_and_allows_retry(clock):
+    assert Counter().value() == 1
+    clock.now += 31
+
+    class Broken(Counter):
+        @cache.swr_cached("test_counter", ttl=30, stale_ttl=300)
+        def value(self):
+            raise RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        Broken().value()
+    assert cache._swr_refreshing == set()
+    assert Counter().value() == 2
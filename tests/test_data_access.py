@@ -0,0 +1,123 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from core.data_access import BufferedCSVDataAccess, CSVDataAccess
+
+
+FIELDNAMES = ["facility_id", "indicator_name", "count", "timestamp"]
+BACKEND_DIR = Path(__file__).resolve().parents[1] / "backend"
+
+
+def _row(i, **overrides):
+    row = {"facility_id": f"F{i}", "indicator_name": "Malaria", "count": i, "timestamp": f"t{i}"}
+    row.update(overrides)
+    return row
+
+
+def _file_rows(path):
+    return CSVDataAccess(str(path), FIELDNAMES).read_last(10_000)[::-1]
+
+
+def _store(path, **kwargs):
+    kwargs.setdefault("flush_interval", 60)
+    return BufferedCSVDataAccess(str(path), FIELDNAMES, **kwargs)
+
+
+def test_rows_are_buffered_until_max_rows(tmp_path):
+    path = tmp_path / "events.csv"
+    store = _store(path, max_rows=3)
+
+    store.append(_row(1))
+    store.append(_row(2))
+    assert _file_rows(path) == []
+
+    store.append(_row(3))
+    assert [r["facility_id"] for r in _file_rows(path)] == ["F1", "F2", "F3"]
+
+
+def test_partial_rows_fill_missing_fields(tmp_path):
+    path = tmp_path / "events.csv"
+    store = _store(path)
+
+    store.append({"facility_id": "F1", "indicator_name": "Error: bad payload"})
+    store.append(_row(2, timestamp=None))
+    store.flush()
+
+    expected = [
+        {"facility_id": "F1", "indicator_name": "Error: bad payload", "count": "", "timestamp": ""},
+        {"facility_id": "F2", "indicator_name": "Malaria", "count": "2", "timestamp": ""},
+    ]
+    assert _file_rows(path) == expected
+    assert store.read_last(2) == expected[::-1]
+
+
+def test_timer_flushes_a_partial_batch(tmp_path):
+    path = tmp_path / "events.csv"
+    store = _store(path, max_rows=100, flush_interval=0.05)
+
+    store.append(_row(1))
+    deadline = time.monotonic() + 5
+    while not _file_rows(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [r["facility_id"] for r in _file_rows(path)] == ["F1"]
+
+
+def test_buffered_rows_are_flushed_at_exit(tmp_path):
+    path = tmp_path / "events.csv"
+    script = (
+        "from core.data_access import BufferedCSVDataAccess\n"
+        f"store = BufferedCSVDataAccess({str(path)!r}, {FIELDNAMES!r}, flush_interval=60)\n"
+        "store.append({'facility_id': 'F1', 'indicator_name': 'Malaria', 'count': 1, 'timestamp': 't1'})\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=BACKEND_DIR, check=True)
+
+    assert [r["facility_id"] for r in _file_rows(path)] == ["F1"]
+
+
+def test_writers_on_one_file_append_without_overwriting(tmp_path):
+    path = tmp_path / "events.csv"
+    first = _store(path)
+    second = _store(path)
+
+    first.append(_row(1))
+    second.append(_row(2))
+    second.flush()
+    first.flush()
+    # a writer outside the buffered stores lands at the end of file as well
+    CSVDataAccess(str(path), FIELDNAMES).append(_row(3))
+    first.append(_row(4))
+    first.flush()
+
+    assert [r["facility_id"] for r in _file_rows(path)] == ["F2", "F1", "F3", "F4"]
+
+
+def test_read_last_serves_the_tail_and_falls_back_to_the_file(tmp_path):
+    path = tmp_path / "events.csv"
+    seed = CSVDataAccess(str(path), FIELDNAMES)
+    for i in range(1, 4):
+        seed.append(_row(i))
+
+    store = _store(path, tail_size=4)
+    store.append(_row(4))
+    store.append(_row(5))
+
+    # the tail was seeded from the file and holds the newest rows, unflushed ones included
+    assert [r["facility_id"] for r in store.read_last(4)] == ["F5", "F4", "F3", "F2"]
+
+    # a row written behind the store's back proves where each read comes from
+    seed.append(_row(99))
+    assert [r["facility_id"] for r in store.read_last(2)] == ["F5", "F4"]
+    assert [r["facility_id"] for r in store.read_last(10)] == ["F5", "F4", "F99", "F3", "F2", "F1"]
+
+
+def test_tail_rows_match_rows_read_back_from_the_file(tmp_path):
+    path = tmp_path / "events.csv"
+    store = _store(path)
+    for i in range(20):
+        store.append(_row(i, count=i if i % 3 else None))
+    store.append({"facility_id": "F20"})
+    store.flush()
+
+    assert store.read_last(21) == CSVDataAccess(str(path), FIELDNAMES).read_last(21)
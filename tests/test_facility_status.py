@@ -1,15 +1,11 @@
-import os
-from pathlib import Path
-import time
-
 import pytest
 from fastapi.testclient import TestClient
 
 from backend.main import app
+from services import facility_status_service
 
 
 CLIENT = TestClient(app)
-CSV_PATH = Path(__file__).resolve().parent.parent / "backend" / "data" / "facility_status.csv"
 
 
 VALID_PAYLOAD = {
@@ -27,13 +23,13 @@ VALID_PAYLOAD = {
 }
 
 
-def setup_function():
-    # remove CSV if present to ensure fresh state
-    try:
-        if CSV_PATH.exists():
-            CSV_PATH.unlink()
-    except Exception:
-        pass
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    # write partitions and the latest-status snapshot to a fresh directory per test
+    monkeypatch.setattr(facility_status_service, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(facility_status_service, "SNAPSHOT_PATH", tmp_path / "facility_status_latest.csv")
+    monkeypatch.setattr(facility_status_service, "SNAPSHOT_LOCK_PATH", tmp_path / ".facility_status_latest.lock")
+    return tmp_path
 
 
 def test_valid_payload_creates_csv_and_returns_200():
@@ -44,20 +40,19 @@ def test_valid_payload_creates_csv_and_returns_200():
     assert data["facility_id"] == "HSP123"
     assert "city_totals" in data
     # CSV created
-    assert CSV_PATH.exists()
-
-
-def test_negative_values_rejected():
-    bad = VALID_PAYLOAD.copy()
-    bad["beds_available"] = -1
-    resp = CLIENT.post("/facility-status/", json=bad)
-    assert resp.status_code == 422
-
-
-def test_missing_facility_id_rejected():
-    bad = VALID_PAYLOAD.copy()
-    bad.pop("facility_id")
-    resp = CLIENT.post("/facility-status/", json=bad)
+    assert facility_status_service._partition_path().exists()
+
+
+@pytest.mark.parametrize(
+    "mutation",
+    [
+        lambda p: {**p, "beds_available": -1},
+        lambda p: {k: v for k, v in p.items() if k != "facility_id"},
+    ],
+    ids=["negative_values", "missing_facility_id"],
+)
+def test_invalid_payload_rejected(mutation):
+    resp = CLIENT.post("/facility-status/", json=mutation(VALID_PAYLOAD))
     assert resp.status_code == 422
 
 
@@ -68,3 +63,16 @@ def test_crisis_detection_triggers_flag():
     assert resp.status_code == 200
     data = resp.json()
     assert data["resource_crisis"] is True
+
+
+def test_totals_use_latest_report_per_facility():
+    first = {**VALID_PAYLOAD, "beds_available": 12, "icu_available": 3}
+    second = {**VALID_PAYLOAD, "beds_available": 7, "icu_available": 1}
+    assert CLIENT.post("/facility-status/", json=first).status_code == 200
+    resp = CLIENT.post("/facility-status/", json=second)
+    assert resp.status_code == 200
+    totals = resp.json()["city_totals"]
+    assert totals["total_beds"] == 7
+    assert totals["total_icu"] == 1
+    assert totals["total_ventilators"] == second["ventilators_available"]
+    assert totals["total_oxygen"] == second["oxygen_units_available"]
@@ -0,0 +1,99 @@
+import math
+
+import pandas as pd
+import pytest
+
+from utils.indicator_normalizer import (
+    INDICATOR_MAPPING,
+    normalize_disease_names,
+    normalize_indicator_name,
+)
+
+
+# Expected values are what the original keyword scan returned for each input
+CASES = [
+    # case, separator and whitespace variants
+    ("malaria", "New Malaria Cases"),
+    ("MALARIA", "New Malaria Cases"),
+    ("  Malaria  ", "New Malaria Cases"),
+    ("malaria-cases", "New Malaria Cases"),
+    ("malaria_cases", "New Malaria Cases"),
+    ("malaria__--cases", "New Malaria Cases"),
+    ("new  malaria\tcases\nidentified", "New Malaria Cases"),
+    ("New malaria-cases identified", "New Malaria Cases"),
+    ("TB-Cases", "Tuberculosis Cases"),
+    ("Cases of TB", "Tuberculosis Cases"),
+    ("Hiv", "HIV Cases"),
+    # keys an earlier key shadowed in the ordered scan
+    ("new malaria", "New Malaria Cases"),
+    ("malaria identified", "New Malaria Cases"),
+    ("tb cases", "Tuberculosis Cases"),
+    ("tuberculosis cases", "Tuberculosis Cases"),
+    ("dengue fever", "Dengue Cases"),
+    ("hepatitis b", "Hepatitis Cases"),
+    ("hiv positive", "HIV Cases"),
+    ("seasonal flu", "Influenza Cases"),
+    ("influenza like illness", "Influenza Cases"),
+    ("maternal deaths", "Maternal Mortality"),
+    ("neonatal deaths", "Neonatal Mortality"),
+    ("Deaths", "Deaths"),
+    # first key in mapping order wins when several match
+    ("tb and malaria", "New Malaria Cases"),
+    ("malaria deaths", "New Malaria Cases"),
+    ("measles mortality", "Measles Cases"),
+    # death/mortality words outside the mapping fall back to 'Deaths'
+    ("mortality", "Deaths"),
+    ("Infant Mortality", "Deaths"),
+    ("Inpatient Deaths - Male", "Deaths"),
+    ("death_count", "Deaths"),
+    # unmatched names are only stripped
+    ("Low Birth Weight", "Low Birth Weight"),
+    ("unmapped indicator  ", "unmapped indicator"),
+    ("  Something_Else ", "Something_Else"),
+    ("x", "x"),
+    # empty and missing values
+    ("", "Unknown"),
+    (None, "Unknown"),
+    (0, "Unknown"),
+    ([], "Unknown"),
+]
+
+
+@pytest.mark.parametrize("raw, expected", CASES)
+def test_normalize_indicator_name(raw, expected):
+    assert normalize_indicator_name(raw) == expected
+
+
+def test_nan_is_returned_unchanged():
+    assert math.isnan(normalize_indicator_name(float("nan")))
+
+
+@pytest.mark.parametrize("key", list(INDICATOR_MAPPING))
+def test_mapping_keys_resolve_like_the_ordered_scan(key):
+    # the original scan returned the canonical form of the first key, in
+    # mapping order, contained in the input
+    earlier = next(k for k in INDICATOR_MAPPING if k in key)
+    assert normalize_indicator_name(key) == INDICATOR_MAPPING[earlier]
+
+
+@pytest.mark.parametrize("value", [["malaria"], {"name": "malaria"}, {"malaria"}])
+def test_unhashable_input_is_returned_unchanged(value):
+    assert normalize_indicator_name(value) is value
+
+
+def test_normalize_disease_names_matches_per_row_normalization():
+    raw = ["malaria", "TB-Cases", "malaria", None, "", "Infant Mortality", "  Other "]
+    df = pd.DataFrame({"indicatorname": raw})
+
+    normalize_disease_names(df)
+
+    assert df["indicatorname"].tolist() == [normalize_indicator_name(v) for v in raw]
+
+
+def test_normalize_disease_names_handles_unhashable_cells():
+    cell = ["malaria"]
+    df = pd.DataFrame({"indicatorname": ["malaria", cell, None]})
+
+    normalize_disease_names(df)
+
+    assert df["indicatorname"].tolist() == ["New Malaria Cases", cell, "Unknown"]
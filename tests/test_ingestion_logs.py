@@ -0,0 +1,70 @@
+from collections import deque
+
+import orjson
+import pytest
+
+from core.data_access import BufferedCSVDataAccess
+from services import ingestion_service
+
+
+EVENT = {
+    "facility_id": "HSP123",
+    "transaction_type": "CASE",
+    "department": "Emergency",
+    "indicator_name": "Malaria",
+    "month": "Feb",
+}
+
+
+@pytest.fixture(autouse=True)
+def stores(tmp_path, monkeypatch):
+    # audit CSVs, outbreak window and /logs payload cache private to each test
+    for name in ("ingested_store", "failed_store"):
+        store = BufferedCSVDataAccess(str(tmp_path / f"{name}.csv"), ingestion_service.FIELDNAMES)
+        monkeypatch.setattr(ingestion_service, name, store)
+    monkeypatch.setattr(ingestion_service, "_outbreak_window", deque(maxlen=ingestion_service.OUTBREAK_WINDOW))
+    monkeypatch.setattr(ingestion_service, "_json_cache", {})
+
+
+def test_recent_json_includes_a_new_ingest(memory_db):
+    ingestion_service.process_ingest(memory_db, {**EVENT, "indicator_name": "Dengue"})
+    before = orjson.loads(ingestion_service.get_recent_json(50))
+    assert before == orjson.loads(ingestion_service.get_recent_json(50))
+
+    result = ingestion_service.process_ingest(memory_db, EVENT)
+    assert result["status"] == "ingested"
+
+    after = orjson.loads(ingestion_service.get_recent_json(50))
+    assert len(after) == len(before) + 1
+    assert after[0]["indicator_name"] == "Malaria"
+
+
+def test_failed_json_includes_a_new_failure(memory_db):
+    assert orjson.loads(ingestion_service.get_failed_json(50)) == []
+
+    result = ingestion_service.process_ingest(memory_db, {**EVENT, "transaction_type": "REFERRAL"})
+    assert result["status"] == "failed"
+
+    after = orjson.loads(ingestion_service.get_failed_json(50))
+    assert len(after) == 1
+    assert after[0]["facility_id"] == "HSP123"
+    assert after[0]["indicator_name"].startswith("Error:")
+
+
+def test_payload_built_during_a_write_is_not_cached():
+    # a reader that read the store before a write must not cache that payload
+    reads = []
+
+    def read_then_write(n):
+        rows = ingestion_service.get_recent(n)
+        reads.append(rows)
+        if len(reads) == 1:
+            ingestion_service.ingested_store.append({"facility_id": "LATE"})
+            ingestion_service._bump_json_version("recent")
+        return rows
+
+    stale = ingestion_service._cached_json("recent", 50, read_then_write)
+    fresh = ingestion_service._cached_json("recent", 50, read_then_write)
+
+    assert orjson.loads(stale) == []
+    assert [row["facility_id"] for row in orjson.loads(fresh)] == ["LATE"]
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core import cache
+from core.database import Base
+from models.orm import Facility, FacilityStatus, PatientTransaction
+from services.prediction_service import PredictionService
+
+
+ADMISSIONS = [0, 1, 5, 7, 100, 133, 250]
+BEDS = [0, 1, 3, 13, 50]
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    now = datetime.utcnow()
+    for count in ADMISSIONS:
+        for beds in BEDS:
+            facility_id = f"F{count}_{beds}"
+            session.add(Facility(
+                facility_id=facility_id, facility_type="Hospital",
+                district="Solapur", subdistrict="North", ward="Ward-1",
+            ))
+            session.add(FacilityStatus(
+                facility_id=facility_id, beds_available=beds,
+                medicine_stock_status="Adequate", timestamp=now - timedelta(minutes=5),
+            ))
+            session.bulk_insert_mappings(PatientTransaction, [
+                {
+                    "facility_id": facility_id, "transaction_type": "CASE",
+                    "department": "Emergency", "indicator_name": "Malaria",
+                    "month": "Feb", "timestamp": now - timedelta(hours=1),
+                }
+                for _ in range(count)
+            ])
+    # A facility with admissions but no status report at all
+    session.add(Facility(
+        facility_id="NOSTATUS", facility_type="PHC",
+        district="Solapur", subdistrict="South", ward="Ward-2",
+    ))
+    session.bulk_insert_mappings(PatientTransaction, [
+        {
+            "facility_id": "NOSTATUS", "transaction_type": "CASE",
+            "department": "Emergency", "indicator_name": "Malaria",
+            "month": "Feb", "timestamp": now - timedelta(hours=1),
+        }
+        for _ in range(4)
+    ])
+    session.commit()
+
+    cache._cache.clear()
+    yield session
+    cache._cache.clear()
+    session.close()
+
+
+def test_predict_all_facilities_matches_scalar_predictions(db):
+    service = PredictionService(db)
+    batched = service.predict_all_facilities()["predictions"]
+
+    assert len(batched) == len(ADMISSIONS) * len(BEDS) + 1
+    for prediction in batched:
+        assert prediction == service.predict_bed_demand(prediction["facility_id"])
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from core.database import get_db
+from models.orm import Facility, FacilityStatus, PatientTransaction
+
+
+# ward -> (cases in the last hour, ICU beds free out of 20)
+WARDS = {
+    "Ward-1": (250, 0),   # CRITICAL
+    "Ward-2": (240, 0),   # CRITICAL
+    "Ward-3": (230, 0),   # CRITICAL
+    "Ward-4": (40, 4),    # HIGH
+    "Ward-5": (30, 4),    # HIGH
+    "Ward-6": (0, 20),    # LOW
+}
+
+
+@pytest.fixture()
+def client(memory_db):
+    now = datetime.utcnow()
+    for ward, (cases, icu_free) in WARDS.items():
+        facility_id = f"F-{ward}"
+        memory_db.add(Facility(
+            facility_id=facility_id, facility_type="Hospital", district="Solapur",
+            subdistrict="North", ward=ward,
+        ))
+        memory_db.add(FacilityStatus(
+            facility_id=facility_id, icu_available=icu_free,
+            medicine_stock_status="Adequate", timestamp=now - timedelta(hours=1),
+        ))
+        memory_db.bulk_insert_mappings(PatientTransaction, [
+            {
+                "facility_id": facility_id, "transaction_type": "CASE",
+                "department": "Emergency", "indicator_name": "Malaria",
+                "month": "Feb", "timestamp": now - timedelta(hours=1),
+            }
+            for _ in range(cases)
+        ])
+    memory_db.commit()
+
+    app.dependency_overrides[get_db] = lambda: memory_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def _wards(response, key):
+    assert response.status_code == 200, response.text
+    return [(r["ward"], r["risk_level"]) for r in response.json()[key]]
+
+
+def test_critical_wards_without_limit(client):
+    wards = _wards(client.get("/analytics/critical-wards"), "critical_wards")
+
+    assert wards == [("Ward-1", "CRITICAL"), ("Ward-2", "CRITICAL"), ("Ward-3", "CRITICAL")]
+
+
+def test_high_risk_wards_without_limit(client):
+    wards = _wards(client.get("/analytics/high-risk-wards"), "high_risk_wards")
+
+    assert [w for w, _ in wards] == ["Ward-1", "Ward-2", "Ward-3", "Ward-4", "Ward-5"]
+    assert [level for _, level in wards] == ["CRITICAL"] * 3 + ["HIGH"] * 2
+
+
+@pytest.mark.parametrize("path, key, limit", [
+    ("/analytics/critical-wards", "critical_wards", 2),
+    ("/analytics/high-risk-wards", "high_risk_wards", 4),
+    ("/analytics/high-risk-wards", "high_risk_wards", 50),
+])
+def test_limit_returns_the_highest_risk_prefix(client, path, key, limit):
+    full = client.get(path).json()[key]
+    limited = client.get(path, params={"limit": limit}).json()[key]
+
+    assert limited == full[:limit]
+
+
+def test_limited_and_unlimited_lists_come_from_the_heatmap(client):
+    heatmap = client.get("/analytics/ward-risk").json()["wards"]
+    limited = client.get("/analytics/high-risk-wards", params={"limit": 2}).json()["high_risk_wards"]
+
+    assert limited == heatmap[:2]
+
+
+@pytest.mark.parametrize("path", ["/analytics/critical-wards", "/analytics/high-risk-wards"])
+@pytest.mark.parametrize("limit", [0, -1])
+def test_non_positive_limit_is_rejected(client, path, limit):
+    assert client.get(path, params={"limit": limit}).status_code == 422
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+from models.orm import Facility, FacilityStatus, PatientTransaction
+from services.ward_risk_service import WardRiskService
+
+
+def _facility(db, facility_id, ward, icu_capacity=20):
+    db.add(Facility(
+        facility_id=facility_id, facility_type="Hospital", district="Solapur",
+        subdistrict="North", ward=ward, icu_capacity=icu_capacity,
+    ))
+
+
+def _status(db, facility_id, icu_available, age):
+    db.add(FacilityStatus(
+        facility_id=facility_id, icu_available=icu_available,
+        medicine_stock_status="Adequate", timestamp=datetime.utcnow() - age,
+    ))
+
+
+def _events(db, facility_id, count, age, transaction_type="CASE"):
+    db.bulk_insert_mappings(PatientTransaction, [
+        {
+            "facility_id": facility_id, "transaction_type": transaction_type,
+            "department": "Emergency", "indicator_name": "Malaria",
+            "month": "Feb", "timestamp": datetime.utcnow() - age,
+        }
+        for _ in range(count)
+    ])
+
+
+def _seed(db):
+    hour = timedelta(hours=1)
+
+    # Busy ward: one facility reporting (latest status wins), one never reporting,
+    # cases in both windows, vaccinations and an event outside the 24h window
+    _facility(db, "A1", "Ward-A")
+    _facility(db, "A2", "Ward-A", icu_capacity=8)
+    _status(db, "A1", icu_available=15, age=5 * hour)
+    _status(db, "A1", icu_available=4, age=hour)
+    _events(db, "A1", 30, hour)
+    _events(db, "A2", 10, 12 * hour)
+    _events(db, "A1", 5, hour, "VACCINATION")
+    _events(db, "A2", 7, 30 * hour)
+
+    # ICU pressure only, no cases at all
+    _facility(db, "B1", "Ward-B")
+    _status(db, "B1", icu_available=2, age=hour)
+
+    # Vaccinations only and no status reports
+    _facility(db, "C1", "Ward-C")
+    _events(db, "C1", 40, hour, "VACCINATION")
+
+    # Two identical wards tie on score
+    for ward, facility_id in (("Ward-E", "E1"), ("Ward-D", "D1")):
+        _facility(db, facility_id, ward)
+        _status(db, facility_id, icu_available=10, age=hour)
+        _events(db, facility_id, 20, 2 * hour)
+
+    # Saturated: cases and growth capped at 100, ICU full
+    _facility(db, "F1", "Ward-F")
+    _status(db, "F1", icu_available=0, age=hour)
+    _events(db, "F1", 250, hour)
+
+    # More ICU beds reported free than staffed (clamped to 0), plus a
+    # zero-capacity facility that reports a status
+    _facility(db, "G1", "Ward-G", icu_capacity=5)
+    _facility(db, "G2", "Ward-G", icu_capacity=0)
+    _status(db, "G1", icu_available=10, age=hour)
+    _status(db, "G2", icu_available=0, age=hour)
+    _events(db, "G2", 3, 3 * hour)
+
+    # A facility without a ward is never part of the heatmap
+    _facility(db, "X1", "")
+    _status(db, "X1", icu_available=0, age=hour)
+    _events(db, "X1", 100, hour)
+
+    db.commit()
+
+
+def test_all_wards_risk_matches_per_ward_scoring(memory_db):
+    _seed(memory_db)
+    service = WardRiskService(memory_db)
+
+    result = WardRiskService.get_all_wards_risk.__wrapped__(service)
+
+    expected = sorted(
+        (service.compute_ward_risk(f"Ward-{ward}") for ward in "ABCDEFG"),
+        key=lambda r: (-r["risk_score"], r["ward"]),
+    )
+    assert result["wards"] == expected
+    assert result["total_wards"] == 7
+    assert result["critical_count"] == sum(r["risk_level"] == "CRITICAL" for r in expected)
+    assert result["high_count"] == sum(r["risk_level"] == "HIGH" for r in expected)
+
+    # The tied wards come back in ward order
+    tied = [r["ward"] for r in result["wards"] if r["ward"] in ("Ward-D", "Ward-E")]
+    assert tied == ["Ward-D", "Ward-E"]
+
+
+def test_all_wards_risk_on_empty_database(memory_db):
+    result = WardRiskService.get_all_wards_risk.__wrapped__(WardRiskService(memory_db))
+
+    assert result["wards"] == []
+    assert result["total_wards"] == 0